@@ -1,15 +1,17 @@
 import datetime as dt
 import json
 import logging
-import os
 import re
 
 from fastapi import APIRouter
 from fastapi.responses import PlainTextResponse
 
 from seguimiento_parlamentario.core.db import get_db, PineconeDatabase
-from seguimiento_parlamentario.core.exceptions import VideoNotFoundError
-from seguimiento_parlamentario.core.tasks import create_task
+from seguimiento_parlamentario.core.exceptions import (
+    VideoNotFoundError,
+    VideoUrlNotFoundError,
+)
+from seguimiento_parlamentario.core.tasks import create_task, create_tasks
 from seguimiento_parlamentario.core.utils import (
     convert_datetime_strings_to_datetime,
     get_timezone,
@@ -20,6 +22,7 @@ from seguimiento_parlamentario.extraction.scrapers import (
     SenateScraper,
 )
 from seguimiento_parlamentario.extraction.videos import get_video_processor
+from seguimiento_parlamentario.processing import prompting
 from seguimiento_parlamentario.processing.mindmaps import get_mindmap
 from seguimiento_parlamentario.processing.summarizer import get_summarizer
 
@@ -38,6 +41,22 @@ scrapers = {
 TZ = get_timezone()
 logger = logging.getLogger(__name__)
 
+# JSON object inside the fenced code block of a generated mindmap
+MINDMAP_JSON_REGEX = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+def parse_mindmap(text: str) -> dict:
+    """
+    Extract the mindmap JSON object from a language model response.
+
+    Args:
+        text (str): Generated mindmap response.
+
+    Returns:
+        dict: Parsed mindmap.
+    """
+    return json.loads(MINDMAP_JSON_REGEX.search(text).group(1))
+
 
 @router.post("/extract/{commission_id}")
 async def extract(commission_id: int, data: ExtractRequest):
@@ -68,22 +87,23 @@ async def extract(commission_id: int, data: ExtractRequest):
         else today
     )
 
-    new_sessions = scraper.process_data(
+    # Sessions are queued for transcription as soon as each one is scraped
+    new_sessions = 0
+    for session in scraper.iter_sessions(
         commission_id=commission["id"], start=start, end=end
-    )
+    ):
+        create_task("transcript", session)
+        new_sessions += 1
 
     if not data.get("finish"):
         db.update_last_scraping(commission["id"], today)
 
-    for session in new_sessions:
-        create_task("transcript", session)
-
     logger.info(
-        f"Extraction completed for commission {commission_id}: Found {len(new_sessions)} sessions"
+        f"Extraction completed for commission {commission_id}: Found {new_sessions} sessions"
     )
 
     return PlainTextResponse(
-        f"Extraction completed for commission {commission_id}: Found {len(new_sessions)} sessions"
+        f"Extraction completed for commission {commission_id}: Found {new_sessions} sessions"
     )
 
 
@@ -101,11 +121,11 @@ async def transcript(request: TranscriptRequest):
     db = get_db()
     session = convert_datetime_strings_to_datetime(request)
     commission = db.find_commission(session["commission_id"])
-    processor = get_video_processor(session)
+    processor = get_video_processor(session, commission)
 
     try:
-        logger.info(f"Retrieving transcript from YouTube for session {session['id']}")
-        result = processor.get_transcription_from_yt(session)
+        logger.info(f"Transcribing video for session {session['id']}")
+        result = await processor.get_transcription(session)
 
         vector_db = PineconeDatabase()
         vector_db.upsert_records(result)
@@ -114,14 +134,13 @@ async def transcript(request: TranscriptRequest):
 
         if commission["automatic_processing_enabled"]:
             session_id = result["id"]
-            create_task(f"summarize/{session_id}", {})
-            create_task(f"mindmap/{session_id}", {})
+            create_tasks(
+                [(f"summarize/{session_id}", {}), (f"mindmap/{session_id}", {})]
+            )
 
         return PlainTextResponse(f"Transcription found for session {session['id']}")
-    except VideoNotFoundError as e:
-        logger.info(
-            f"No YouTube transcript found for session {session['id']}: {e.message}"
-        )
+    except (VideoNotFoundError, VideoUrlNotFoundError) as e:
+        logger.info(f"No video found for session {session['id']}: {e.message}")
         return PlainTextResponse(e.message)
 
 
@@ -150,7 +169,7 @@ async def summarize(session_id: int):
         summary = summarizer.process(data)
         result = {
             "session_id": session["id"],
-            "model": os.getenv("MODEL_NAME"),
+            "model": prompting.MODEL_NAME,
             "summary": summary,
         }
         db.add_summary(result)
@@ -179,17 +198,16 @@ async def mindmap(session_id: int):
         db.find_session(session_id, detailed=True)
     )
     commission = db.find_commission(session["commission_id"])
-    pattern = r"```(?:json)?\s*(\{.*?\})\s*```"
 
     data = {"session": session, "commission": commission}
 
     try:
         mindmap_generator = get_mindmap(data)
-        mindmap = mindmap_generator.process(data)
+        mindmap = mindmap_generator.process(data, parse=parse_mindmap)
         result = {
             "session_id": session["id"],
-            "model": os.getenv("MODEL_NAME"),
-            "mindmap": json.loads(re.search(pattern, mindmap, re.DOTALL).group(1)),
+            "model": prompting.MODEL_NAME,
+            "mindmap": mindmap,
         }
         db.add_mindmap(result)
         return PlainTextResponse(
@@ -213,7 +231,6 @@ async def trigger():
     db = get_db()
     commissions = db.get_commissions_ids()
 
-    for commission_id in commissions:
-        create_task(f"extract/{commission_id}", {})
+    create_tasks((f"extract/{commission_id}", {}) for commission_id in commissions)
 
     return PlainTextResponse(f"Processing {len(commissions)} commissions")
@@ -1,14 +1,35 @@
 from celery import Celery
 from celery.schedules import crontab
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import requests
 import os
 
 app = Celery("tasks", broker=os.getenv("AMQP_URL"))
 
+# Long-running scrapes should not hold prefetched messages hostage
+app.conf.task_acks_late = True
+app.conf.worker_prefetch_multiplier = 1
+
+# Keep-alive connections to the API, shared by every task in the worker
+adapter = HTTPAdapter(
+    pool_connections=100,
+    pool_maxsize=100,
+    max_retries=Retry(total=3, backoff_factor=0.2),
+)
+http = requests.Session()
+http.mount("http://", adapter)
+http.mount("https://", adapter)
+
 
 @app.task
 def send_request(endpoint, payload):
-    requests.post(url=f"{os.getenv('APP_URL')}/processing/{endpoint}", json=payload)
+    # Processing endpoints can run for minutes, so only connecting is time-bounded
+    http.post(
+        url=f"{os.getenv('APP_URL')}/processing/{endpoint}",
+        json=payload,
+        timeout=(3, None),
+    )
 
 
 app.conf.beat_schedule = {
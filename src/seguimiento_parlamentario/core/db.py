@@ -24,6 +24,13 @@ scrapers = [
 
 TZ = get_timezone()
 
+# Seconds a cached language model response is kept
+PROMPT_CACHE_TTL = 24 * 60 * 60
+# Model used by the Pinecone index, and to embed queries against it
+EMBEDDING_MODEL = "llama-text-embed-v2"
+# Maximum number of query embeddings remembered
+EMBEDDING_CACHE_SIZE = 4096
+
 
 class DataBase(ABC):
     """
@@ -191,6 +198,30 @@ class DataBase(ABC):
         """
         pass
 
+    @abstractmethod
+    def find_prompt_response(self, key: str) -> str:
+        """
+        Retrieve a cached language model response that has not expired.
+
+        Parameters:
+            key (str): Hash identifying the model and prompt of the request.
+
+        Returns:
+            str: The cached response, or None if there is none.
+        """
+        pass
+
+    @abstractmethod
+    def add_prompt_response(self, key: str, response: str):
+        """
+        Cache a language model response for `PROMPT_CACHE_TTL`.
+
+        Parameters:
+            key (str): Hash identifying the model and prompt of the request.
+            response (str): The generated response.
+        """
+        pass
+
     @abstractmethod
     def update_extraction_enabled(self, commission_id: int, enabled: bool):
         """
@@ -258,6 +289,12 @@ class MongoDatabase(DataBase):
         collection = self.db["mindmaps"]
         collection.create_index([("session_id", ASCENDING)])
 
+        collection = self.db["prompt_responses"]
+        collection.create_index([("key", ASCENDING)], unique=True)
+        collection.create_index(
+            [("created_at", ASCENDING)], expireAfterSeconds=PROMPT_CACHE_TTL
+        )
+
     def find_commissions(self, detailed: bool = False) -> list[dict]:
         if detailed:
             result = self.db["commissions"].find({}, {"_id": 0})
@@ -319,7 +356,7 @@ class MongoDatabase(DataBase):
     def get_commissions_ids(self) -> list[int]:
         commission_table = self.db["commissions"]
 
-        rows = commission_table.find({"extraction_enabled": True}, {"id": 1})
+        rows = commission_table.find({"extraction_enabled": True}, {"_id": 0, "id": 1})
 
         ids = [row["id"] for row in rows]
 
@@ -350,6 +387,27 @@ class MongoDatabase(DataBase):
         mindmaps.insert_many([new_mindmap])
         del new_mindmap["_id"]
 
+    def find_prompt_response(self, key: str) -> str:
+        min_date = dt.datetime.now(tz=dt.timezone.utc) - dt.timedelta(
+            seconds=PROMPT_CACHE_TTL
+        )
+        result = self.db["prompt_responses"].find_one(
+            {"key": key, "created_at": {"$gte": min_date}}, {"_id": 0}
+        )
+        return result["response"] if result else None
+
+    def add_prompt_response(self, key: str, response: str):
+        self.db["prompt_responses"].update_one(
+            {"key": key},
+            {
+                "$set": {
+                    "response": response,
+                    "created_at": dt.datetime.now(tz=dt.timezone.utc),
+                }
+            },
+            upsert=True,
+        )
+
     def update_extraction_enabled(self, commission_id: int, enabled: bool):
         self.db["commissions"].update_one(
             {"id": commission_id}, {"$set": {"extraction_enabled": enabled}}
@@ -479,8 +537,10 @@ class FirestoreDatabase(DataBase):
         return docs[0].to_dict()
 
     def get_commissions_ids(self) -> list[int]:
-        ref = self.client.collection("commissions").where(
-            "extraction_enabled", "==", True
+        ref = (
+            self.client.collection("commissions")
+            .where("extraction_enabled", "==", True)
+            .select(["id"])
         )
         docs = ref.stream()
         return [doc.to_dict()["id"] for doc in docs]
@@ -515,6 +575,22 @@ class FirestoreDatabase(DataBase):
         doc_ref = self.client.collection("mindmaps").document(str(new_mindmap["id"]))
         doc_ref.set(new_mindmap)
 
+    def find_prompt_response(self, key: str) -> str:
+        doc = self.client.collection("prompt_responses").document(key).get()
+        if not doc.exists:
+            return None
+        result = doc.to_dict()
+        age = dt.datetime.now(tz=dt.timezone.utc) - result["created_at"]
+        if age > dt.timedelta(seconds=PROMPT_CACHE_TTL):
+            return None
+        return result["response"]
+
+    def add_prompt_response(self, key: str, response: str):
+        doc_ref = self.client.collection("prompt_responses").document(key)
+        doc_ref.set(
+            {"response": response, "created_at": dt.datetime.now(tz=dt.timezone.utc)}
+        )
+
     def update_extraction_enabled(self, commission_id: int, enabled: bool):
         self.db.collection("commissions").document(str(commission_id)).update(
             {"extraction_enabled": enabled}
@@ -537,6 +613,9 @@ class PineconeDatabase:
 
     _instance = None
     _lock = Lock()
+    # Query embeddings, by case-folded query
+    _embeddings = {}
+    _embeddings_lock = Lock()
 
     def __new__(cls):
         with cls._lock:
@@ -555,7 +634,7 @@ class PineconeDatabase:
                 cloud="aws",
                 region="us-east-1",
                 embed={
-                    "model": "llama-text-embed-v2",
+                    "model": EMBEDDING_MODEL,
                     "field_map": {"text": "chunk_text"},
                 },
             )
@@ -600,8 +679,43 @@ class PineconeDatabase:
                 records=batched_chunks,
             )
 
+    def embed(self, text: str) -> list[float]:
+        """
+        Embeds a query with the same model the index uses for its records.
+
+        The query is embedded as written, only stripped of surrounding
+        whitespace. Embeddings are memoized by the case-folded query, so
+        repeated queries that only differ in case or spacing skip the
+        embedding request.
+
+        Parameters:
+            text (str): Text query to embed.
+
+        Returns:
+            list: The embedding values of the query.
+        """
+        text = text.strip()
+        key = " ".join(text.casefold().split())
+
+        with self._embeddings_lock:
+            values = self._embeddings.get(key)
+        if values is None:
+            embeddings = self.pc.inference.embed(
+                model=EMBEDDING_MODEL,
+                inputs=[text],
+                parameters={"input_type": "query"},
+            )
+            values = embeddings[0].values
+            with self._embeddings_lock:
+                self._embeddings[key] = values
+                # Oldest entries go first
+                while len(self._embeddings) > EMBEDDING_CACHE_SIZE:
+                    del self._embeddings[next(iter(self._embeddings))]
+
+        return list(values)
+
     def retrieve_records(
-        self, query: str, filters: dict = {}, top_k: int = 5
+        self, query: str, filters: dict = {}, top_k: int = 5, vector: list = None
     ) -> list[dict]:
         """
         Searches the Pinecone index for transcript chunks matching the input query,
@@ -612,6 +726,9 @@ class PineconeDatabase:
             filters (dict, optional): Dictionary of filter conditions to apply
                 on metadata fields (e.g., {'commission_id': '123'}). Defaults to empty dict.
             top_k (int, optional): Maximum number of top matches to return. Defaults to 5.
+            vector (list, optional): Embedding of the query, if it was already
+                computed. When given, the index searches with it instead of
+                embedding the query again.
 
         Returns:
             list: A list of matching records containing 'session_id' and 'chunk_text'.
@@ -623,9 +740,15 @@ class PineconeDatabase:
         """
         index = self.pc.Index(host=os.getenv("PINECONE_INDEX_HOST"))
 
+        search_query = (
+            {"vector": {"values": vector}}
+            if vector is not None
+            else {"inputs": {"text": query}}
+        )
+
         results = index.search(
             namespace="transcript_chunks",
-            query={"inputs": {"text": query}, "top_k": top_k, "filter": filters},
+            query={**search_query, "top_k": top_k, "filter": filters},
             fields=["session_id", "chunk_text"],
         )
 
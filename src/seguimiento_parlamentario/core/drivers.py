@@ -1,3 +1,8 @@
+import atexit
+from contextlib import contextmanager
+from threading import Condition
+
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
@@ -10,3 +15,153 @@ def get_driver():
     options.add_argument("--window-size=2560,1440")
 
     return webdriver.Chrome(options=options)
+
+
+def get_page_tree(driver):
+    """
+    Parse the page currently loaded in the driver.
+
+    Fetches the rendered HTML in a single round-trip so the page can be queried
+    locally, with every link resolved against the current URL.
+
+    Args:
+        driver: Selenium WebDriver instance
+
+    Returns:
+        lxml.html.HtmlElement: Root element of the parsed page
+    """
+    tree = lxml.html.fromstring(driver.page_source)
+    tree.make_links_absolute(driver.current_url)
+    return tree
+
+
+def get_text(element):
+    """
+    Get the text of a parsed element with its whitespace collapsed.
+
+    Args:
+        element: lxml element
+
+    Returns:
+        str: Element text, as Selenium would render it on a single line
+    """
+    return " ".join(element.text_content().split())
+
+
+class DriverPool:
+    """
+    Pool of reusable WebDriver instances.
+
+    Drivers are created lazily, up to the pool size, and handed out through
+    `checkout`. Once returned, a driver is reset and kept for the next caller,
+    so the browser startup cost is only paid once per pooled driver.
+    """
+
+    def __init__(self, size=2):
+        """
+        Initialize an empty driver pool.
+
+        Args:
+            size: Maximum number of drivers kept by the pool
+        """
+        self.size = size
+        self.__idle = []
+        self.__drivers = []
+        # Slots taken by live drivers and by drivers still starting up
+        self.__slots = 0
+        self.__condition = Condition()
+        atexit.register(self.close)
+
+    @contextmanager
+    def checkout(self):
+        """
+        Borrow a driver from the pool for the duration of a `with` block.
+
+        Waits for a driver to be returned, or for a slot to free up, if all of
+        them are in use. A driver that can't be reset after use is discarded
+        instead of returned.
+
+        Yields:
+            Selenium WebDriver instance
+        """
+        driver = self.__acquire()
+        try:
+            yield driver
+        finally:
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception:
+                # A dead chromedriver surfaces as connection errors, not only
+                # WebDriverException
+                self.__discard(driver)
+            else:
+                with self.__condition:
+                    self.__idle.append(driver)
+                    self.__condition.notify()
+
+    def close(self):
+        """
+        Quit every driver created by the pool.
+        """
+        with self.__condition:
+            drivers, self.__drivers = self.__drivers, []
+            self.__idle.clear()
+            self.__slots -= len(drivers)
+            self.__condition.notify_all()
+        for driver in drivers:
+            self.__quit(driver)
+
+    def __acquire(self):
+        """
+        Helper method to take an idle driver, creating one if the pool isn't full.
+
+        Returns:
+            Selenium WebDriver instance
+        """
+        with self.__condition:
+            while not self.__idle and self.__slots >= self.size:
+                self.__condition.wait()
+            if self.__idle:
+                return self.__idle.pop()
+            # Reserve the slot so the browser can start outside the lock
+            self.__slots += 1
+
+        try:
+            driver = get_driver()
+        except BaseException:
+            with self.__condition:
+                self.__slots -= 1
+                self.__condition.notify()
+            raise
+
+        with self.__condition:
+            self.__drivers.append(driver)
+        return driver
+
+    def __discard(self, driver):
+        """
+        Helper method to quit a broken driver and free its slot in the pool.
+
+        Args:
+            driver: Selenium WebDriver instance to discard
+        """
+        with self.__condition:
+            if driver in self.__drivers:
+                self.__drivers.remove(driver)
+                self.__slots -= 1
+                self.__condition.notify()
+        self.__quit(driver)
+
+    def __quit(self, driver):
+        """
+        Helper method to quit a driver, ignoring errors from a browser that is
+        already gone.
+
+        Args:
+            driver: Selenium WebDriver instance to quit
+        """
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -18,3 +18,14 @@ class VideoUrlNotFoundError(Exception):
         self.session_id = session_id
         self.message = f"{message}: {session_id}"
         super().__init__(self.message)
+
+
+class TranscriptionError(Exception):
+    """Exception raised when none of a session's audio chunks could be transcribed."""
+
+    def __init__(
+        self, session_id: str, message: str = "Could not transcribe video for session"
+    ):
+        self.session_id = session_id
+        self.message = f"{message}: {session_id}"
+        super().__init__(self.message)
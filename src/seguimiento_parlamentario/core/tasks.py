@@ -1,5 +1,6 @@
 from seguimiento_parlamentario.core.utils import convert_datetime_in_dict
 from seguimiento_parlamentario.celery.app import send_request
+from celery import group
 from google.cloud import tasks_v2
 import json
 import os
@@ -24,6 +25,26 @@ def create_task(endpoint, payload):
         return
 
 
+def create_tasks(tasks):
+    """
+    Create several asynchronous tasks at once using the configured backend.
+
+    On Celery all tasks are dispatched together as a single group, so workers
+    can pick them up concurrently. On Google Cloud Tasks they are created one
+    by one, as the API does not support batch creation.
+
+    Args:
+        tasks: Iterable of (endpoint, payload) tuples
+    """
+    if os.getenv("SERVICE_MODE") == "gcloud":
+        for endpoint, payload in tasks:
+            create_gcloud_task(endpoint, payload)
+        return
+    if os.getenv("SERVICE_MODE") == "celery":
+        create_celery_group(tasks)
+        return
+
+
 def create_gcloud_task(endpoint, payload):
     """
     Create a task using Google Cloud Tasks.
@@ -72,3 +93,20 @@ def create_celery_task(endpoint, payload):
     """
     payload = convert_datetime_in_dict(payload)
     send_request.delay(endpoint, payload)
+
+
+def create_celery_group(tasks):
+    """
+    Create a group of Celery tasks.
+
+    Builds a send_request signature for each (endpoint, payload) pair and
+    dispatches them all with a single apply_async call.
+
+    Args:
+        tasks: Iterable of (endpoint, payload) tuples
+    """
+    job = group(
+        send_request.s(endpoint, convert_datetime_in_dict(payload))
+        for endpoint, payload in tasks
+    )
+    job.apply_async()
@@ -1,8 +1,12 @@
 import datetime as dt
 import pytz
 import re
+from functools import lru_cache
+from itertools import groupby
 import tiktoken
 import unicodedata
+from babel import Locale
+from babel.dates import format_datetime
 
 # Basic ISO 8601 regex
 ISO_DATETIME_REGEX = re.compile(
@@ -12,6 +16,15 @@ ISO_DATETIME_REGEX = re.compile(
     r"(Z|[+-]\d{2}:\d{2})?)?$"  # Z or +hh:mm (optional)
 )
 
+# Boundary between sentences, used to split transcripts
+SENTENCE_BOUNDARY_REGEX = re.compile(r"(?<=[.!?])\s+")
+
+# Lowercase Spanish accented letters mapped to their ASCII equivalents
+ACCENT_TABLE = str.maketrans("áéíóúüñ", "aeiouun")
+
+# Locale data used to format session dates, parsed once
+ES_LOCALE = Locale.parse("es")
+
 
 def get_timezone():
     """
@@ -147,18 +160,50 @@ def normalize_text(text):
     """
     Normalize text by removing accents and converting to lowercase.
 
-    Performs Unicode normalization (NFD) to separate base characters from
-    combining marks (accents), then removes the combining marks and converts
-    to lowercase for consistent text processing.
+    Spanish accented letters are folded with a precomputed translation table.
+    Any other non-ASCII text falls back to Unicode compatibility decomposition
+    (NFKD) followed by an ASCII encode, which drops the combining marks
+    (accents) and any remaining non-ASCII symbols in C.
 
     Args:
         text: Text string to normalize
 
     Returns:
-        str: Normalized text without accents in lowercase
+        str: Normalized ASCII text without accents in lowercase
+    """
+    text = text.lower().translate(ACCENT_TABLE)
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
+
+def compact_transcript(text):
+    """
+    Shrink a transcript before sending it to a language model.
+
+    Collapses runs of whitespace and drops sentences that repeat the one right
+    before them, as speech-to-text models tend to emit the same filler phrase
+    many times over silences or background noise.
+
+    Args:
+        text: Transcript text to compact
+
+    Returns:
+        str: Compacted transcript
+    """
+    sentences = SENTENCE_BOUNDARY_REGEX.split(" ".join(text.split()))
+    return " ".join(sentence for sentence, _ in groupby(sentences))
+
+
+@lru_cache(maxsize=1024)
+def format_session_date(start):
+    """
+    Format the start of a session as a long Spanish date, memoized by datetime.
+
+    Args:
+        start: Datetime the session started
+
+    Returns:
+        String with the formatted date (e.g. "martes 3 de junio de 2025")
     """
-    return "".join(
-        c
-        for c in unicodedata.normalize("NFD", text.lower())
-        if unicodedata.category(c) != "Mn"
-    )
+    return format_datetime(start, "EEEE d 'de' MMMM 'de' y", locale=ES_LOCALE)
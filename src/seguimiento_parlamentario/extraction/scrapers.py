@@ -3,21 +3,61 @@ import importlib.resources as pkg_resources
 import json
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 
+import lxml.html
+import requests
+from requests.adapters import HTTPAdapter
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.ui import WebDriverWait
+from urllib3.util.retry import Retry
 
 from seguimiento_parlamentario import config
-from seguimiento_parlamentario.core.drivers import get_driver
+from seguimiento_parlamentario.core.drivers import DriverPool, get_page_tree, get_text
 from seguimiento_parlamentario.core.utils import get_timezone
 
 
 TZ = get_timezone()
 
+# Search keywords per chamber and commission, loaded once from the package config
+with (
+    pkg_resources.files(config)
+    .joinpath("yt-keywords.json")
+    .open("r", encoding="utf-8") as f
+):
+    KEYWORDS = json.load(f)
+
+# Senate session headers mapped to their context keys
+CONTEXT_HEADERS = {
+    "Tema": "topic",
+    "Aspectos considerados": "aspects",
+    "Acuerdos": "agreements",
+}
+
+# Patterns matched once per listed row, compiled at import
+LEGISLATURE_DATES_REGEX = re.compile(r"(\d{2}/\d{2}/\d{4}) al (\d{2}/\d{2}/\d{4})")
+SENATE_COMMISSION_ID_REGEX = re.compile(r"\d+")
+SENATE_SESSION_ID_REGEX = re.compile(r"/\d+/(\d+)")
+CHAMBER_SESSION_ID_REGEX = re.compile(r"prmIdSesion=(\d+)")
+CHAMBER_COMMISSION_ID_REGEX = re.compile(r"prmID=(\d+)")
+
+# Returns the text and value of every legislature option
+LEGISLATURE_OPTIONS_SCRIPT = """
+return Array.from(document.getElementById('legislatura').options)
+    .map(option => [option.text, option.value]);
+"""
+
+# Checks whether the Senate sessions table only holds the "no results" row
+EMPTY_RESULTS_SCRIPT = """
+const cell = document.querySelector('table tbody tr td');
+return cell?.innerText.trim() === 'No hay resultados que coincidan con la búsqueda';
+"""
+
 
 class Scraper(ABC):
     """
@@ -36,6 +76,8 @@ class Scraper(ABC):
         """
         self.url = url
         self.driver = None
+        # Drivers are kept between calls
+        self.driver_pool = DriverPool(size=2)
 
     def process_data(
         self, commission_id: int, start: dt.datetime, end: dt.datetime
@@ -55,21 +97,57 @@ class Scraper(ABC):
             List of dictionaries containing complete session data including
             general info, context, and attendance
         """
-        driver = get_driver()
-        sessions = self.get_sessions(driver, commission_id, start, end)
-        sessions = list(
-            filter(lambda s: s["start"] >= start and s["start"] <= end, sessions)
-        )
+        return list(self.iter_sessions(commission_id, start, end))
 
-        for session in sessions:
-            session["context"] = self.get_context(driver, session["id"], commission_id)
-            session["attendance"] = self.get_attendance(
-                driver, session["id"], commission_id
-            )
+    def iter_sessions(
+        self, commission_id: int, start: dt.datetime, end: dt.datetime
+    ) -> Iterator[dict]:
+        """
+        Scrape parliamentary sessions one at a time.
 
-        driver.quit()
+        Works like `process_data`, but yields each session as soon as its context
+        and attendance are available, so callers can start processing it while
+        the remaining sessions are still being scraped.
 
-        return sessions
+        Args:
+            commission_id: The ID of the parliamentary commission
+            start: The start date of the period to scrape
+            end: The end date of the period to scrape
+
+        Yields:
+            Dictionaries containing complete session data including
+            general info, context, and attendance
+        """
+        with self.driver_pool.checkout() as driver:
+            sessions = self.get_sessions(driver, commission_id, start, end)
+
+            for session in sessions:
+                session["context"], session["attendance"] = self.get_session_details(
+                    driver, session["id"], commission_id
+                )
+                yield session
+
+    def get_session_details(
+        self, driver, session_id: int, commission_id: int
+    ) -> tuple[list[dict], list[dict]]:
+        """
+        Retrieve both the context and the attendance of a specific session.
+
+        Scrapers that can fetch both more efficiently than one after the other
+        override this method.
+
+        Args:
+            driver: Selenium WebDriver instance
+            session_id: The ID of the session
+            commission_id: The ID of the commission
+
+        Returns:
+            Tuple with the session context and attendance data
+        """
+        return (
+            self.get_context(driver, session_id, commission_id),
+            self.get_attendance(driver, session_id, commission_id),
+        )
 
     @abstractmethod
     def get_sessions(
@@ -78,6 +156,8 @@ class Scraper(ABC):
         """
         Retrieve session metadata from a parliamentary commission within a date range.
 
+        Only sessions starting between `start` and `end` (inclusive) are returned.
+
         Args:
             driver: Selenium WebDriver instance
             commission_id: The ID of the commission
@@ -147,6 +227,8 @@ class SenateScraper(Scraper):
         self.__session_url = (
             lambda commission_id, session_id: f"{self.url}/{commission_id}/{session_id}"
         )
+        # One driver per legislature scraped at the same time
+        self.__legislature_pool = DriverPool(size=4)
 
     def get_sessions(
         self, driver, commission_id: int, start: dt.datetime, end: dt.datetime
@@ -166,101 +248,77 @@ class SenateScraper(Scraper):
         Returns:
             List of dictionaries containing session metadata
         """
-        driver.get(self.__commission_url(commission_id))
-
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "//button[text()='Sesiones']"))
-        )
-
-        # Move to sessions section
-        button = driver.find_element(By.XPATH, "//button[text()='Sesiones']")
-        ActionChains(driver).scroll_to_element(button).perform()
-        button.click()
+        self.__open_sessions(driver, commission_id)
 
-        select = Select(driver.find_element(By.ID, "legislatura"))
+        options = driver.execute_script(LEGISLATURE_OPTIONS_SCRIPT)
         values = []
         # Filter out selection option outside date range
-        for option in select.options:
-            match = re.search(
-                r"(\d{2}/\d{2}/\d{4}) al (\d{2}/\d{2}/\d{4})", option.text
-            )
+        for text, value in options:
+            match = LEGISLATURE_DATES_REGEX.search(text)
             start_date = dt.datetime.strptime(match.group(1), "%d/%m/%Y").astimezone(TZ)
             end_date = dt.datetime.strptime(match.group(2), "%d/%m/%Y").astimezone(TZ)
             if (start <= end_date) and (end >= start_date):
-                values.append(option.get_attribute("value"))
+                values.append(value)
+
+        # Each legislature is scraped concurrently on its own browser instance
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = executor.map(
+                lambda value: self.__get_legislature_sessions(
+                    commission_id, value, start, end
+                ),
+                dict.fromkeys(values),
+            )
 
         sessions = []
+        for legislature_sessions in results:
+            sessions += legislature_sessions
 
-        for value in list(set(values)):
-            WebDriverWait(driver, 5).until(
-                lambda d: d.find_element(By.ID, "legislatura").is_enabled()
-            )
-            select.select_by_value(value)
-            while True:
-                WebDriverWait(driver, 5).until(
-                    lambda d: d.find_element(By.ID, "legislatura").is_enabled()
-                )
+        return sessions
 
-                # Find next page button to handle pagination
-                try:
-                    next_arrow = driver.find_element(
-                        By.XPATH,
-                        "//a[contains(text(), 'Siguiente') and not(contains(@class, 'disabled'))]",
-                    )
-                    ActionChains(driver).scroll_to_element(next_arrow).perform()
-                except NoSuchElementException:
-                    next_arrow = None
+    def get_context(self, driver, session_id: int, commission_id: int) -> list[dict]:
+        """
+        Extract contextual information from a specific Senate session.
 
-                new_sessions = []
+        Scrapes session details including topics, aspects considered, and agreements
+        from the Senate's session detail page.
 
-                table = driver.find_elements(By.XPATH, "//table//tbody//tr")
+        Args:
+            driver: Selenium WebDriver instance
+            session_id: The ID of the Senate session
+            commission_id: The ID of the Senate commission
 
-                for row in table:
-                    elements = row.find_elements(By.TAG_NAME, "td")
-                    if (
-                        elements[0].text
-                        == "No hay resultados que coincidan con la búsqueda"
-                    ):
-                        break
-                    date = dt.datetime.strptime(elements[0].text, "%d/%m/%Y").date()
-                    start_time = dt.datetime.strptime(elements[2].text, "%H:%M").time()
-                    end_time = dt.datetime.strptime(elements[3].text, "%H:%M").time()
-                    new_sessions.append(
-                        {
-                            "id": int(
-                                re.search(
-                                    r"/\d+/(\d+)",
-                                    elements[4]
-                                    .find_element("tag name", "a")
-                                    .get_attribute("href"),
-                                ).group(1)
-                            ),
-                            "commission_id": commission_id,
-                            "start": dt.datetime.combine(date, start_time).astimezone(
-                                TZ
-                            ),
-                            "finish": dt.datetime.combine(date, end_time).astimezone(
-                                TZ
-                            ),
-                        }
-                    )
+        Returns:
+            List of dictionaries containing session context information
+        """
+        return self.__parse_context(
+            self.__open_session(driver, session_id, commission_id)
+        )
 
-                sessions += new_sessions
+    def get_attendance(self, driver, session_id: int, commission_id: int) -> list[dict]:
+        """
+        Extract attendance information from a specific Senate session.
 
-                # Iterate until there's no more pages
-                if next_arrow is None:
-                    break
+        Scrapes member and guest attendance data from the Senate's session detail page.
 
-                next_arrow.click()
+        Args:
+            driver: Selenium WebDriver instance
+            session_id: The ID of the Senate session
+            commission_id: The ID of the Senate commission
 
-        return sessions
+        Returns:
+            Dictionary containing lists of members and guests who attended
+        """
+        return self.__parse_attendance(
+            self.__open_session(driver, session_id, commission_id)
+        )
 
-    def get_context(self, driver, session_id: int, commission_id: int) -> list[dict]:
+    def get_session_details(
+        self, driver, session_id: int, commission_id: int
+    ) -> tuple[list[dict], dict]:
         """
-        Extract contextual information from a specific Senate session.
+        Retrieve both the context and the attendance of a specific Senate session.
 
-        Scrapes session details including topics, aspects considered, and agreements
-        from the Senate's session detail page.
+        Both are read from the same session detail page, so it is loaded once.
 
         Args:
             driver: Selenium WebDriver instance
@@ -268,7 +326,64 @@ class SenateScraper(Scraper):
             commission_id: The ID of the Senate commission
 
         Returns:
-            List of dictionaries containing session context information
+            Tuple with the session context and attendance data
+        """
+        tree = self.__open_session(driver, session_id, commission_id)
+        return self.__parse_context(tree), self.__parse_attendance(tree)
+
+    def get_commissions(self) -> list[dict]:
+        """
+        Retrieve all Senate commissions with their metadata.
+
+        Scrapes the Senate's main commissions page to extract commission IDs,
+        names, and associated search keywords from configuration.
+
+        Returns:
+            List of dictionaries containing Senate commission information
+        """
+        with self.driver_pool.checkout() as driver:
+            driver.get(self.url)
+
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located(
+                    (
+                        By.XPATH,
+                        "//div[@class='tabs__content']//div[@class='component']//a",
+                    )
+                )
+            )
+
+            commissions_content = get_page_tree(driver).xpath(
+                "//div[@class='tabs__content']//div[@class='component']//a"
+            )
+
+        commissions = []
+        for commission in commissions_content:
+            id = SENATE_COMMISSION_ID_REGEX.search(commission.get("href")).group(0)
+            name = get_text(commission.xpath(".//span")[0])
+
+            commissions.append(
+                {
+                    "id": int(id),
+                    "name": name,
+                    "chamber": "Senado",
+                    "search_keywords": KEYWORDS["Senado"][id],
+                }
+            )
+
+        return commissions
+
+    def __open_session(self, driver, session_id: int, commission_id: int):
+        """
+        Load a Senate session detail page and return its parsed HTML tree.
+
+        Args:
+            driver: Selenium WebDriver instance
+            session_id: The ID of the Senate session
+            commission_id: The ID of the Senate commission
+
+        Returns:
+            lxml tree of the rendered session page
         """
         driver.get(self.__session_url(commission_id, session_id))
 
@@ -276,120 +391,176 @@ class SenateScraper(Scraper):
             EC.presence_of_element_located((By.CLASS_NAME, "dynamic-content"))
         )
 
-        details = driver.find_elements(By.CLASS_NAME, "dynamic-content")
+        return get_page_tree(driver)
+
+    def __parse_context(self, tree) -> list[dict]:
+        """
+        Extract the session context from a Senate session page tree.
+
+        Args:
+            tree: lxml tree of the session page
+
+        Returns:
+            List of dictionaries containing session context information
+        """
+        details = tree.xpath(
+            "//*[contains(concat(' ', @class, ' '), ' dynamic-content ')]"
+        )
         info = []
 
         for element in details:
             data = {}
-            try:
-                data["topic"] = element.find_element(
-                    By.XPATH, "./h4[contains(text(), 'Tema')]/following-sibling::p"
-                ).text
-            except NoSuchElementException:
-                pass
-
-            try:
-                data["aspects"] = element.find_element(
-                    By.XPATH,
-                    "./h4[contains(text(), 'Aspectos considerados')]/following-sibling::p",
-                ).text
-            except NoSuchElementException:
-                pass
-
-            try:
-                data["agreements"] = element.find_element(
-                    By.XPATH,
-                    "./h4[contains(text(), 'Acuerdos')]/following-sibling::p",
-                ).text
-            except NoSuchElementException:
-                pass
+            # Pair each header with the first paragraph after it, before the next one
+            header_text = None
+            for child in element.iterchildren("h4", "p"):
+                if child.tag == "h4":
+                    header_text = get_text(child)
+                    continue
+                if header_text is None:
+                    continue
+                for title, key in CONTEXT_HEADERS.items():
+                    if title in header_text and key not in data:
+                        data[key] = get_text(child)
+                header_text = None
 
             info.append(data)
 
         return info
 
-    def get_attendance(self, driver, session_id: int, commission_id: int) -> list[dict]:
+    def __parse_attendance(self, tree) -> dict:
         """
-        Extract attendance information from a specific Senate session.
-
-        Scrapes member and guest attendance data from the Senate's session detail page.
+        Extract members and guests from a Senate session page tree.
 
         Args:
-            driver: Selenium WebDriver instance
-            session_id: The ID of the Senate session
-            commission_id: The ID of the Senate commission
+            tree: lxml tree of the session page
 
         Returns:
             Dictionary containing lists of members and guests who attended
         """
-        driver.get(self.__session_url(commission_id, session_id))
-
-        WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "dynamic-content"))
+        details = tree.xpath(
+            "//*[contains(concat(' ', @class, ' '), ' dynamic-content ')]"
         )
-
-        details = driver.find_elements(By.CLASS_NAME, "dynamic-content")
         members = set()
         guests = set()
 
         for element in details:
-            attendees = element.find_elements(
-                By.XPATH, "./h4[contains(text(), 'Integrantes')]/following-sibling::p"
+            attendees = element.xpath(
+                "./h4[contains(text(), 'Integrantes')]/following-sibling::p"
             )[:-1]
-            members.update(set(map(lambda a: a.text, attendees[:-1])))
-            guests.add(attendees[-1].text)
+            members.update(get_text(attendee) for attendee in attendees[:-1])
+            guests.add(get_text(attendees[-1]))
 
         return {
             "members": list(members),
             "guests": list(guests),
         }
 
-    def get_commissions(self) -> list[dict]:
+    def __open_sessions(self, driver, commission_id: int):
         """
-        Retrieve all Senate commissions with their metadata.
+        Navigate to a commission page and open its sessions section.
 
-        Scrapes the Senate's main commissions page to extract commission IDs,
-        names, and associated search keywords from configuration.
+        Args:
+            driver: Selenium WebDriver instance
+            commission_id: The ID of the Senate commission
+        """
+        driver.get(self.__commission_url(commission_id))
+
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.XPATH, "//button[text()='Sesiones']"))
+        )
+
+        # Move to sessions section
+        button = driver.find_element(By.XPATH, "//button[text()='Sesiones']")
+        ActionChains(driver).scroll_to_element(button).perform()
+        button.click()
+
+    def __get_legislature_sessions(
+        self, commission_id: int, value: str, start: dt.datetime, end: dt.datetime
+    ) -> list[dict]:
+        """
+        Extract the sessions of a commission within a single legislature and date range.
+
+        Borrows its own WebDriver from the legislature pool so several legislatures
+        can be scraped at the same time without sharing page state. Sessions are
+        listed from newest to oldest, so pagination stops at the first session
+        older than `start`.
+
+        Args:
+            commission_id: The ID of the Senate commission
+            value: Value of the legislature option to select
+            start: Start date for session filtering
+            end: End date for session filtering
 
         Returns:
-            List of dictionaries containing Senate commission information
+            List of dictionaries containing session metadata
         """
-        driver = get_driver()
-        driver.get(self.url)
+        with self.__legislature_pool.checkout() as driver:
+            self.__open_sessions(driver, commission_id)
 
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located(
-                (By.XPATH, "//div[@class='tabs__content']//div[@class='component']//a")
+            WebDriverWait(driver, 5).until(
+                lambda d: d.find_element(By.ID, "legislatura").is_enabled()
             )
-        )
+            Select(driver.find_element(By.ID, "legislatura")).select_by_value(value)
 
-        commissions_content = driver.find_elements(
-            By.XPATH, "//div[@class='tabs__content']//div[@class='component']//a"
-        )
+            sessions = []
+            reached_start = False
 
-        with (
-            pkg_resources.files(config)
-            .joinpath("yt-keywords.json")
-            .open("r", encoding="utf-8") as f
-        ):
-            keywords = json.load(f)
-            commissions = []
-            for commission in commissions_content:
-                id = re.search(r"\d+", commission.get_attribute("href")).group(0)
-                name = commission.find_element(By.TAG_NAME, "span").text
-
-                commissions.append(
-                    {
-                        "id": int(id),
-                        "name": name,
-                        "chamber": "Senado",
-                        "search_keywords": keywords["Senado"][id],
-                    }
+            while True:
+                WebDriverWait(driver, 5).until(
+                    lambda d: d.find_element(By.ID, "legislatura").is_enabled()
                 )
 
-        driver.quit()
+                # Skip legislatures without sessions before scanning the table
+                if driver.execute_script(EMPTY_RESULTS_SCRIPT):
+                    break
 
-        return commissions
+                # Find next page button to handle pagination
+                try:
+                    next_arrow = driver.find_element(
+                        By.XPATH,
+                        "//a[contains(text(), 'Siguiente') and not(contains(@class, 'disabled'))]",
+                    )
+                    ActionChains(driver).scroll_to_element(next_arrow).perform()
+                except NoSuchElementException:
+                    next_arrow = None
+
+                new_sessions = []
+
+                table = get_page_tree(driver).xpath("//table//tbody//tr")
+
+                for row in table:
+                    elements = [get_text(cell) for cell in row.xpath(".//td")]
+                    href = row.xpath(".//td[5]//a/@href")[0]
+                    date = dt.datetime.strptime(elements[0], "%d/%m/%Y").date()
+                    start_time = dt.datetime.strptime(elements[2], "%H:%M").time()
+                    end_time = dt.datetime.strptime(elements[3], "%H:%M").time()
+                    session_start = dt.datetime.combine(date, start_time).astimezone(TZ)
+                    session_finish = dt.datetime.combine(date, end_time).astimezone(TZ)
+
+                    if session_start > end:
+                        continue
+                    if session_start < start:
+                        reached_start = True
+                        break
+
+                    new_sessions.append(
+                        {
+                            "id": int(SENATE_SESSION_ID_REGEX.search(href).group(1)),
+                            "commission_id": commission_id,
+                            "start": session_start,
+                            "finish": session_finish,
+                        }
+                    )
+
+                sessions += new_sessions
+
+                # Iterate until there's no more pages or the date range is covered
+                if next_arrow is None or reached_start:
+                    break
+
+                next_arrow.click()
+
+        return sessions
 
 
 class ChamberOfDeputiesScraper(Scraper):
@@ -416,6 +587,16 @@ class ChamberOfDeputiesScraper(Scraper):
         self.__attendance_url = (
             lambda c_id, s_id: f"{self.url}/asistencia.aspx?prmId={c_id}&prmIdSesion={s_id}"
         )
+        # Pooled HTTP session to reuse connections across static page fetches
+        self.__http = requests.Session()
+        self.__http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=64,
+                max_retries=Retry(total=3, backoff_factor=0.2),
+            ),
+        )
         self.__month_dict = {
             "ene.": 1,
             "feb.": 2,
@@ -453,51 +634,45 @@ class ChamberOfDeputiesScraper(Scraper):
 
         sessions = []
 
-        for year in range(start.year, end.year + 1):
-            self.__select(driver, "year", str(year))
-            print(
-                start,
-                dt.datetime(year=year, month=1, day=1).astimezone(TZ),
+        # First and last month to query for each year in the date range
+        months_by_year = {
+            year: (
+                start.month if year == start.year else 1,
+                end.month if year == end.year else 12,
             )
-            for month in range(
-                max(
-                    start,
-                    dt.datetime(year=year, month=1, day=1).astimezone(TZ),
-                ).month,
-                min(
-                    end,
-                    dt.datetime(year=year, month=12, day=31).astimezone(TZ),
-                ).month
-                + 1,
-            ):
+            for year in range(start.year, end.year + 1)
+        }
+
+        for year, (first_month, last_month) in months_by_year.items():
+            self.__select(driver, "year", str(year))
+            for month in range(first_month, last_month + 1):
                 self.__select(driver, "mes", str(month).zfill(2))
-                rows = driver.find_elements(By.XPATH, "//table//tbody//tr")
+                rows = get_page_tree(driver).xpath("//table//tbody//tr")
                 for row in rows:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    try:
-                        session_id = re.search(
-                            r"prmIdSesion=(\d+)",
-                            cells[10]
-                            .find_element(By.TAG_NAME, "a")
-                            .get_attribute("href"),
-                        ).group(1)
-                        date = self.__str_to_date(cells[1].text)
-                        start_time = dt.datetime.strptime(cells[2].text, "%H:%M").time()
-                        end_time = dt.datetime.strptime(cells[3].text, "%H:%M").time()
-                        sessions.append(
-                            {
-                                "id": int(session_id),
-                                "commission_id": commission_id,
-                                "start": dt.datetime.combine(
-                                    date, start_time
-                                ).astimezone(TZ),
-                                "finish": dt.datetime.combine(
-                                    date, end_time
-                                ).astimezone(TZ),
-                            }
-                        )
-                    except NoSuchElementException:
+                    cells = row.xpath(".//td")
+                    links = cells[10].xpath(".//a/@href")
+                    if not links:
                         continue
+                    session_id = CHAMBER_SESSION_ID_REGEX.search(links[0]).group(1)
+                    date = self.__str_to_date(get_text(cells[1]))
+                    start_time = dt.datetime.strptime(
+                        get_text(cells[2]), "%H:%M"
+                    ).time()
+                    end_time = dt.datetime.strptime(get_text(cells[3]), "%H:%M").time()
+                    session_start = dt.datetime.combine(date, start_time).astimezone(TZ)
+                    # Months at the edges of the range may hold sessions outside it
+                    if not start <= session_start <= end:
+                        continue
+                    sessions.append(
+                        {
+                            "id": int(session_id),
+                            "commission_id": commission_id,
+                            "start": session_start,
+                            "finish": dt.datetime.combine(date, end_time).astimezone(
+                                TZ
+                            ),
+                        }
+                    )
 
         return sessions
 
@@ -506,27 +681,28 @@ class ChamberOfDeputiesScraper(Scraper):
         Extract contextual information from a specific Chamber of Deputies session.
 
         Scrapes session results including citations and outcomes from the
-        Chamber of Deputies' session results page.
+        Chamber of Deputies' session results page. The page is served as static
+        HTML, so it is fetched over HTTP instead of through the driver.
 
         Args:
-            driver: Selenium WebDriver instance
+            driver: Selenium WebDriver instance (unused)
             session_id: The ID of the Chamber of Deputies session
             commission_id: The ID of the Chamber of Deputies commission
 
         Returns:
             List of dictionaries containing session results and citations
         """
-        driver.get(self.__results_url(commission_id, session_id))
+        tree = self.__fetch_page(self.__results_url(commission_id, session_id))
 
         results = []
 
-        rows = driver.find_elements(By.XPATH, "//table//tbody//tr")
+        rows = tree.xpath("//table//tbody//tr")
         for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
+            cells = row.xpath(".//td")
             results.append(
                 {
-                    "citation": cells[0].text,
-                    "result": cells[1].text,
+                    "citation": get_text(cells[0]),
+                    "result": get_text(cells[1]),
                 }
             )
 
@@ -537,33 +713,61 @@ class ChamberOfDeputiesScraper(Scraper):
         Extract attendance information from a specific Chamber of Deputies session.
 
         Scrapes attendee names and their attendance status from the
-        Chamber of Deputies' attendance page.
+        Chamber of Deputies' attendance page. The page is served as static
+        HTML, so it is fetched over HTTP instead of through the driver.
 
         Args:
-            driver: Selenium WebDriver instance
+            driver: Selenium WebDriver instance (unused)
             session_id: The ID of the Chamber of Deputies session
             commission_id: The ID of the Chamber of Deputies commission
 
         Returns:
             List of dictionaries containing attendee names and their status
         """
-        driver.get(self.__attendance_url(commission_id, session_id))
+        tree = self.__fetch_page(self.__attendance_url(commission_id, session_id))
 
         attendance = []
 
-        attendees = driver.find_elements(By.CLASS_NAME, "integrante")
+        attendees = tree.xpath(
+            "//*[contains(concat(' ', normalize-space(@class), ' '), ' integrante ')]"
+        )
 
         for attendee in attendees:
-            info = attendee.find_elements(By.TAG_NAME, "p")
+            info = attendee.xpath(".//p")
             attendance.append(
                 {
-                    "name": info[0].text,
-                    "status": info[1].text,
+                    "name": get_text(info[0]),
+                    "status": get_text(info[1]),
                 }
             )
 
         return attendance
 
+    def get_session_details(
+        self, driver, session_id: int, commission_id: int
+    ) -> tuple[list[dict], list[dict]]:
+        """
+        Retrieve both the context and the attendance of a specific Chamber of Deputies session.
+
+        Results and attendance live on different pages, so they are fetched concurrently.
+
+        Args:
+            driver: Selenium WebDriver instance (unused)
+            session_id: The ID of the Chamber of Deputies session
+            commission_id: The ID of the Chamber of Deputies commission
+
+        Returns:
+            Tuple with the session context and attendance data
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            context = executor.submit(
+                self.get_context, driver, session_id, commission_id
+            )
+            attendance = executor.submit(
+                self.get_attendance, driver, session_id, commission_id
+            )
+            return context.result(), attendance.result()
+
     def get_commissions(self) -> list[dict]:
         """
         Retrieve all Chamber of Deputies commissions with their metadata.
@@ -574,36 +778,24 @@ class ChamberOfDeputiesScraper(Scraper):
         Returns:
             List of dictionaries containing Chamber of Deputies commission information
         """
-        driver = get_driver()
-        driver.get(f"{self.url}/comisiones_permanentes.aspx")
-
-        commissions_content = driver.find_elements(By.XPATH, "//table//tbody//tr")
+        with self.driver_pool.checkout() as driver:
+            driver.get(f"{self.url}/comisiones_permanentes.aspx")
+            commissions_content = get_page_tree(driver).xpath("//table//tbody//tr")
 
         commissions = []
-        with (
-            pkg_resources.files(config)
-            .joinpath("yt-keywords.json")
-            .open("r", encoding="utf-8") as f
-        ):
-            keywords = json.load(f)
-            for commission in commissions_content:
-                commission_cell = commission.find_elements(By.TAG_NAME, "td")[1]
-                id = re.search(
-                    r"prmID=(\d+)",
-                    commission_cell.find_element(By.TAG_NAME, "a").get_attribute(
-                        "href"
-                    ),
-                ).group(1)
-                commissions.append(
-                    {
-                        "id": int(id),
-                        "name": f"Comisión de {commission_cell.text}",
-                        "chamber": "Cámara de Diputados",
-                        "search_keywords": keywords["Cámara de Diputados"][id],
-                    }
-                )
-
-        driver.quit()
+        for commission in commissions_content:
+            commission_cell = commission.xpath(".//td")[1]
+            id = CHAMBER_COMMISSION_ID_REGEX.search(
+                commission_cell.xpath(".//a/@href")[0]
+            ).group(1)
+            commissions.append(
+                {
+                    "id": int(id),
+                    "name": f"Comisión de {get_text(commission_cell)}",
+                    "chamber": "Cámara de Diputados",
+                    "search_keywords": KEYWORDS["Cámara de Diputados"][id],
+                }
+            )
 
         return commissions
 
@@ -622,6 +814,20 @@ class ChamberOfDeputiesScraper(Scraper):
         select = Select(select_element)
         select.select_by_value(value)
 
+    def __fetch_page(self, url):
+        """
+        Helper method to download and parse a static HTML page.
+
+        Args:
+            url: URL of the page to fetch
+
+        Returns:
+            lxml.html.HtmlElement: Root element of the parsed page
+        """
+        response = self.__http.get(url, timeout=30)
+        response.raise_for_status()
+        return lxml.html.fromstring(response.content)
+
     def __str_to_date(self, date_str):
         """
         Convert a Spanish date string to a Python date object.
@@ -1,25 +1,109 @@
+import asyncio
+import contextlib
 import datetime as dt
+import glob
 import os
+import random
 import subprocess
-import unicodedata
+import tempfile
+import time
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
-
-from openai import OpenAI
+from functools import cache, lru_cache
+from pathlib import Path
+
+import lxml.etree
+import lxml.html
+import requests
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.ui import WebDriverWait
+from urllib3.util.retry import Retry
 
 from seguimiento_parlamentario.core.db import get_db
-from seguimiento_parlamentario.core.drivers import get_driver
+from seguimiento_parlamentario.core.drivers import DriverPool, get_text
 from seguimiento_parlamentario.core.exceptions import (
+    TranscriptionError,
     VideoNotFoundError,
     VideoUrlNotFoundError,
 )
 from seguimiento_parlamentario.core.utils import normalize_text
 
+# Seconds a commission stays memoized before it is read from the database again
+COMMISSION_TTL = 60 * 60
+# Seconds a video URL is reused before searching again, as download links can rotate
+VIDEO_URL_TTL = 30 * 60
+# Maximum number of video URLs remembered by each processor
+VIDEO_URL_CACHE_SIZE = 256
+# Directory for the audio chunks, which only live until they are transcribed.
+# Pointing it to a tmpfs such as /dev/shm keeps them off the disk entirely
+AUDIO_CHUNKS_DIR = os.getenv("AUDIO_CHUNKS_DIR") or "./tmp/audios"
+
+
+def get_commission(commission_id):
+    """
+    Retrieve a commission from the database, memoized by ID.
+
+    Commission names, chambers and search keywords rarely change while videos
+    are processed, so repeated lookups for the same commission are served from
+    memory for up to an hour instead of querying the database again.
+
+    Args:
+        commission_id: The ID of the commission
+
+    Returns:
+        Dictionary containing the commission information
+    """
+    return find_commission(commission_id, int(time.monotonic() // COMMISSION_TTL))
+
+
+@lru_cache(maxsize=512)
+def find_commission(commission_id, ttl_bucket):
+    # ttl_bucket only takes part in the cache key, so entries expire when it changes
+    return get_db().find_commission(commission_id)
+
+
+# Returns the text and first link of every Senate search result
+ARTICLES_SCRIPT = """
+return Array.from(document.querySelectorAll('article')).map(article => {
+    const link = article.querySelector('a');
+    return [article.innerText, link ? link.href : null];
+});
+"""
+
+# Returns every Chamber of Deputies search result along with its text
+RESULTS_SCRIPT = """
+return Array.from(arguments[0].querySelectorAll('article > div:has(input)'))
+    .map(result => [result, result.innerText]);
+"""
+
+# Sessions starting before noon are the last result of their day
+NOON = dt.time(hour=12, minute=0)
+
+
+def matches_keywords(text, keywords):
+    """
+    Check whether a text contains every given keyword, ignoring accents and case.
+
+    Args:
+        text: Text to search in
+        keywords: Keywords already normalized with `normalize_text`
+
+    Returns:
+        bool: True if all keywords appear in the text
+    """
+    normalized = normalize_text(text)
+    return all(keyword in normalized for keyword in keywords)
+
 
 class VideoProcessor(ABC):
     """
@@ -29,176 +113,270 @@ class VideoProcessor(ABC):
     processing, and transcribing parliamentary session videos from different chambers.
     """
 
-    def __init__(self, videos_website):
+    def __init__(self, videos_website, max_concurrent=8):
         """
         Initialize the video processor with a base website URL.
 
         Args:
             videos_website: The website URL where the videos are stored
+            max_concurrent: Maximum number of chunks transcribed at the same time
         """
         self.videos_website = videos_website
+        self.max_concurrent = max_concurrent
+        self.driver_pool = DriverPool(size=2)
+        # Video URLs already found, by commission, date, time of day and TTL bucket
+        self.video_urls = {}
 
-    def get_transcription(self, session: dict) -> dict:
+    async def get_transcription(self, session: dict) -> dict:
         """
         Complete pipeline for retrieving and transcribing a parliamentary session video.
 
         This method orchestrates the entire process: finding the video URL, downloading
         the audio, splitting it into chunks, transcribing each chunk, and combining
-        the results into a complete transcript.
+        the results into a complete transcript. Downloading, splitting and
+        transcribing overlap: each chunk is uploaded while ffmpeg keeps writing the
+        following ones. The blocking video search runs in a worker thread, so the
+        caller's event loop is never blocked.
 
         Args:
             session: Dictionary containing parliamentary session information
 
         Returns:
-            Dictionary with session data enhanced with transcript and video_url
+            Dictionary with session data enhanced with transcript and video_url.
+            `partial_transcript` is set when some chunks could not be transcribed
+            and are missing from the transcript.
 
         Raises:
             VideoUrlNotFoundError: If no matching video URL is found
             VideoNotFoundError: If video download fails
+            TranscriptionError: If no chunk could be transcribed
         """
-        video_url = self.get_video_url(session)
-        audio_path = self.download_audio(video_url, f"./tmp/audios", {session["id"]})
-        chunks = self.split_audio(audio_path)
+        key = (
+            session["commission_id"],
+            session["start"].date(),
+            session["start"].time() < NOON,
+            int(time.monotonic() // VIDEO_URL_TTL),
+        )
+        video_url = self.video_urls.get(key)
+        if video_url is None:
+            video_url = await asyncio.to_thread(self.get_video_url, session)
+            self.video_urls[key] = video_url
+            # Oldest entries go first, which also drops those from past TTL buckets
+            while len(self.video_urls) > VIDEO_URL_CACHE_SIZE:
+                del self.video_urls[next(iter(self.video_urls))]
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            transcripts = list(executor.map(self.transcribe_audio, chunks))
+        chunks = self.download_audio(video_url, AUDIO_CHUNKS_DIR, session["id"])
 
-        session["transcript"] = " ".join([x.text for x in transcripts])
+        try:
+            transcripts = await self.transcribe_chunks(chunks)
+        except BaseException:
+            # The URL may have expired, so the next attempt searches for it again
+            self.video_urls.pop(key, None)
+            # Chunks are only deleted once uploaded, so remove the ones left behind
+            with contextlib.suppress(ValueError):
+                chunks.close()
+            for chunk in glob.glob(f"{AUDIO_CHUNKS_DIR}/{session['id']}_part_*.ogg"):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(chunk)
+            raise
+
+        if not any(transcript is not None for transcript in transcripts):
+            raise TranscriptionError(session["id"])
+
+        session["transcript"] = " ".join(
+            transcript for transcript in transcripts if transcript is not None
+        )
+        session["partial_transcript"] = None in transcripts
         session["video_url"] = video_url
 
         return session
 
-    def download_audio(self, url, output_path, session_id):
+    def download_audio(self, url, output_path, session_id, chunk_length=10 * 60):
         """
-        Download video from URL and convert to audio format.
+        Download the audio of a video and split it into chunks in a single pass.
 
-        Uses aria2c for fast multi-connection downloading and ffmpeg for audio conversion.
-        Automatically cleans up the original video file after conversion.
+        ffmpeg reads the video straight from its URL, so the audio is extracted and
+        segmented while the download is still in progress, without writing the
+        full video or audio file to disk. Each chunk is yielded as soon as ffmpeg
+        moves on to the next one, so it can be processed right away.
 
         Args:
             url: Video URL to download
             output_path: Directory path for output files
             session_id: Unique identifier for the session (used in filename)
+            chunk_length: Length of each chunk in seconds (default: 600 = 10 minutes)
 
-        Returns:
-            String path to the converted audio file, or None if conversion fails
+        Yields:
+            File paths of the generated audio chunks, in order
 
         Raises:
             VideoNotFoundError: If download fails
+            FileNotFoundError: If ffmpeg is not installed
         """
-        video_file = f"{output_path}/{session_id}.mp4"
-        audio_file = f"{output_path}/{session_id}.mp3"
-
-        download_command = ["aria2c", "-x", "16", "-s", "16", "-o", video_file, url]
+        os.makedirs(output_path, exist_ok=True)
+        output_pattern = f"{output_path}/{session_id}_part_%03d.ogg"
 
-        try:
-            _ = subprocess.run(
-                download_command, check=True, capture_output=True, text=True
-            )
-            print("Download completed successfully!")
-        except subprocess.CalledProcessError as e:
-            print(f"Download failed: {e}")
-            raise VideoNotFoundError(session_id)
-        except FileNotFoundError:
-            print("aria2c not found. Please install aria2.")
-            return None
-
-        convert_command = [
+        command = [
             "ffmpeg",
+            "-loglevel",
+            "error",
+            # Resume the stream after dropped connections instead of failing
+            "-reconnect",
+            "1",
+            "-reconnect_streamed",
+            "1",
+            "-reconnect_delay_max",
+            "30",
             "-i",
-            video_file,
-            "-q:a",
-            "5",
+            url,
             "-map",
             "a",
-            audio_file,
+            # 16 kHz mono matches what Whisper works with and keeps uploads small
+            "-ac",
+            "1",
+            "-ar",
+            "16000",
+            "-c:a",
+            "libopus",
+            "-b:a",
+            "24k",
+            "-f",
+            "segment",
+            "-segment_time",
+            str(chunk_length),
+            output_pattern,
         ]
 
-        try:
-            _ = subprocess.run(
-                convert_command, check=True, capture_output=True, text=True
-            )
-
-            if os.path.exists(video_file):
-                os.remove(video_file)
-
-            return audio_file
-        except subprocess.CalledProcessError as e:
-            print(f"Conversion failed: {e}")
-            return None
-        except FileNotFoundError:
-            print("ffmpeg not found. Please install ffmpeg.")
-            return None
-
-    def split_audio(self, input_file, chunk_length=10 * 60):
+        # stderr goes to a file, as a pipe nobody reads until the end could fill
+        # up on long streams and stall ffmpeg
+        with tempfile.TemporaryFile(mode="w+") as stderr:
+            try:
+                process = subprocess.Popen(
+                    command, stdout=subprocess.DEVNULL, stderr=stderr
+                )
+            except FileNotFoundError:
+                print("ffmpeg not found. Please install ffmpeg.")
+                raise
+
+            chunks_glob = f"{output_path}/{session_id}_part_*.ogg"
+
+            yielded = 0
+            try:
+                while True:
+                    finished = process.poll() is not None
+                    chunks = sorted(glob.glob(chunks_glob))
+                    # A chunk is complete once ffmpeg starts writing the next one
+                    for chunk in chunks[yielded:-1]:
+                        yield chunk
+                        yielded += 1
+                    if finished:
+                        break
+                    time.sleep(1)
+            finally:
+                # Stop ffmpeg if the chunks stopped being consumed halfway
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+            if process.returncode != 0:
+                stderr.seek(0)
+                print(f"Download failed: {stderr.read()}")
+                raise VideoNotFoundError(session_id)
+
+        print(f"Audio downloaded into chunks with pattern: {output_pattern}")
+        yield from sorted(glob.glob(chunks_glob))[yielded:]
+
+    async def transcribe_chunks(self, chunks):
         """
-        Split audio file into smaller chunks for efficient processing.
+        Transcribe audio chunks concurrently as they become available.
 
-        Uses ffmpeg to segment the audio file into chunks of specified length
-        without re-encoding to maintain quality and speed.
+        Each chunk is sent to the transcription API as soon as it is produced, with
+        at most `max_concurrent` requests in flight. Chunks that fail to transcribe
+        are reported and left as None, so a single failure does not discard the
+        rest and callers can tell a partial transcript from a complete one.
 
         Args:
-            input_file: Path to the input audio file
-            chunk_length: Length of each chunk in seconds (default: 600 = 10 minutes)
+            chunks: Iterator of audio chunk file paths, in order
 
         Returns:
-            List of file paths for the generated audio chunks
+            List of transcribed texts, or None for failed chunks, in chunk order
         """
-        # Get filename without extension
-        base, _ = os.path.splitext(input_file)
-        output_pattern = f"{base}_part_%03d.mp3"
-
-        command = [
-            "ffmpeg",
-            "-i",
-            input_file,
-            "-f",
-            "segment",
-            "-segment_time",
-            str(chunk_length),
-            "-c",
-            "copy",  # no re-encoding
-            output_pattern,
-        ]
-
-        subprocess.run(command, check=True)
-        print(f"Audio split into chunks with pattern: {output_pattern}")
-
-        # Return list of chunk filenames
-        i = 0
-        output_files = []
-        while True:
-            chunk_name = output_pattern % i
-            if os.path.exists(chunk_name):
-                output_files.append(chunk_name)
-                i += 1
-            else:
-                break
-        os.remove(input_file)
-        return output_files
-
-    def transcribe_audio(self, audio_file_path):
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        # A single client shares its connection pool across every chunk upload.
+        # Retries are left to transcribe_audio, which backs off with jitter
+        async with AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"), timeout=120, max_retries=0
+        ) as client:
+
+            async def transcribe(chunk):
+                async with semaphore:
+                    return await self.transcribe_audio(client, chunk)
+
+            # Chunks are transcribed while the following ones are still being written
+            tasks = []
+            try:
+                while (
+                    chunk := await asyncio.to_thread(next, chunks, None)
+                ) is not None:
+                    tasks.append(asyncio.create_task(transcribe(chunk)))
+            except BaseException:
+                # The download failed, so the pending uploads are not worth finishing
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        transcripts = []
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                print(f"Transcription failed for chunk {i}: {result}")
+                result = None
+            transcripts.append(result)
+
+        return transcripts
+
+    async def transcribe_audio(self, client, audio_file_path, max_attempts=6):
         """
         Transcribe an audio file using OpenAI's Whisper API.
 
-        Sends the audio file to OpenAI's transcription service and automatically
-        cleans up the audio file after processing.
+        Reads the audio file into memory, sends it to OpenAI's transcription
+        service and automatically cleans up the audio file after processing,
+        even if the request fails. Rate limited, dropped and server-failed
+        requests are retried with exponential backoff and random jitter, so
+        concurrent chunks that hit the limit together do not retry in lockstep.
 
         Args:
+            client: AsyncOpenAI client used to send the request
             audio_file_path: Path to the audio file to transcribe
+            max_attempts: Maximum number of attempts per chunk
 
         Returns:
-            Transcription object containing the text and metadata
+            String containing the transcribed text
         """
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), timeout=120, max_retries=3)
-        with open(audio_file_path, "rb") as audio_file:
-            transcript = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language="es",
-            )
-        os.remove(audio_file_path)
-        return transcript
+        try:
+            audio_bytes = Path(audio_file_path).read_bytes()
+            for attempt in range(max_attempts):
+                try:
+                    transcript = await client.audio.transcriptions.create(
+                        model="whisper-1",
+                        file=(
+                            os.path.basename(audio_file_path),
+                            audio_bytes,
+                            "audio/ogg",
+                        ),
+                        language="es",
+                    )
+                    break
+                except (RateLimitError, APIConnectionError, InternalServerError):
+                    if attempt == max_attempts - 1:
+                        raise
+                    await asyncio.sleep(random.uniform(0, min(60, 2**attempt)))
+        finally:
+            os.remove(audio_file_path)
+        return transcript.text
 
     @abstractmethod
     def get_video_url(self, session: dict):
@@ -232,6 +410,16 @@ class SenateVideoProcessor(VideoProcessor):
         super().__init__(
             videos_website="https://tv.senado.cl/cgi-bin/prontus_search.cgi?search_prontus=tvsenado",
         )
+        # Pooled HTTP session so repeated searches reuse the same connection
+        self.__http = requests.Session()
+        self.__http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.2),
+            ),
+        )
 
     def get_video_url(self, session):
         """
@@ -241,6 +429,10 @@ class SenateVideoProcessor(VideoProcessor):
         filters results based on matching criteria, and selects the appropriate video
         based on session timing (morning vs afternoon).
 
+        The search is first sent as a plain HTTP request, and the browser is only
+        used when that fails or its response can't be parsed. Results that parse
+        but don't match the commission are final and skip the browser.
+
         Args:
             session: Dictionary containing session information including
                     commission_id, start time, and finish time
@@ -251,62 +443,144 @@ class SenateVideoProcessor(VideoProcessor):
         Raises:
             VideoUrlNotFoundError: If no matching video is found
         """
-        driver = get_driver()
-        driver.get(self.videos_website)
+        try:
+            video_url = self.__get_video_url_with_http(session)
+            if video_url:
+                return video_url
+        # An empty or non-HTML body also falls back to the browser
+        except (requests.RequestException, lxml.etree.LxmlError) as e:
+            print(f"HTTP video search failed for session {session['id']}: {e}")
+
+        return self.__get_video_url_with_driver(session)
+
+    def __get_video_url_with_http(self, session):
+        """
+        Helper method to retrieve the video URL by querying the search endpoint directly.
+
+        Args:
+            session: Dictionary containing session information
 
-        commission = get_db().find_commission(session["commission_id"])
+        Returns:
+            String URL for direct video download, or None if it can't be found
+            in the returned pages
 
-        WebDriverWait(driver, timeout=5).until(
-            EC.presence_of_element_located((By.ID, "buscar"))
+        Raises:
+            VideoUrlNotFoundError: If the search returned results but none of
+                them match the commission
+        """
+        is_morning = session["start"].time() < NOON
+        commission = get_commission(session["commission_id"])
+        keywords = [normalize_text(kw) for kw in commission["search_keywords"]]
+
+        response = self.__http.get(
+            self.videos_website,
+            params={
+                "search_texto": " ".join(commission["search_keywords"]),
+                "SECCION1": "7",
+                "search_fechaini": session["start"].strftime("%d/%m/%Y"),
+                "search_fechafin": session["finish"].strftime("%d/%m/%Y"),
+            },
+            timeout=30,
+        )
+        response.raise_for_status()
+        tree = lxml.html.fromstring(response.content)
+        tree.make_links_absolute(response.url)
+
+        # Morning sessions are the last matching result, so scan from the end
+        articles = tree.xpath("//article")
+        player_url = next(
+            (
+                links[0]
+                for article in (reversed(articles) if is_morning else articles)
+                if (links := article.xpath(".//a/@href"))
+                and matches_keywords(get_text(article), keywords)
+            ),
+            None,
         )
 
-        search_bar = driver.find_element(By.ID, "search_texto")
-        search_bar.send_keys(" ".join(commission["search_keywords"]))
+        # No results usually means the page wasn't rendered as expected, but
+        # results without a match would be the same in the browser
+        if player_url is None:
+            if articles:
+                raise VideoUrlNotFoundError(session["id"])
+            return None
 
-        section = Select(driver.find_element(By.ID, "SECCION1"))
-        section.select_by_value("7")
+        response = self.__http.get(player_url, timeout=30)
+        response.raise_for_status()
+        tree = lxml.html.fromstring(response.content)
+        tree.make_links_absolute(response.url)
 
-        start = driver.find_element(By.ID, "search_fechaini")
-        start.send_keys(session["start"].strftime("%d/%m/%Y"))
-        end = driver.find_element(By.ID, "search_fechafin")
-        end.send_keys(session["finish"].strftime("%d/%m/%Y"))
+        links = tree.xpath("//a[@download]/@href")
+        return links[0] if links else None
 
-        search_button = driver.find_element(By.XPATH, "//input[@value='Buscar']")
-        driver.execute_script("arguments[0].click();", search_button)
+    def __get_video_url_with_driver(self, session):
+        """
+        Helper method to retrieve the video URL by filling the search form in a browser.
 
-        try:
-            WebDriverWait(driver, timeout=10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "article"))
+        Args:
+            session: Dictionary containing session information
+
+        Returns:
+            String URL for direct video download
+
+        Raises:
+            VideoUrlNotFoundError: If no matching video is found
+        """
+        is_morning = session["start"].time() < NOON
+
+        with self.driver_pool.checkout() as driver:
+            driver.get(self.videos_website)
+
+            commission = get_commission(session["commission_id"])
+
+            WebDriverWait(driver, timeout=5).until(
+                EC.presence_of_element_located((By.ID, "buscar"))
             )
-        except:
-            raise VideoUrlNotFoundError(session["id"])
-
-        results = driver.find_elements(By.TAG_NAME, "article")
-        results = list(
-            filter(
-                lambda item: all(
-                    normalize_text(term) in normalize_text(item.text)
-                    for term in commission["search_keywords"]
+
+            keywords = [normalize_text(kw) for kw in commission["search_keywords"]]
+
+            search_bar = driver.find_element(By.ID, "search_texto")
+            search_bar.send_keys(" ".join(commission["search_keywords"]))
+
+            section = Select(driver.find_element(By.ID, "SECCION1"))
+            section.select_by_value("7")
+
+            start = driver.find_element(By.ID, "search_fechaini")
+            start.send_keys(session["start"].strftime("%d/%m/%Y"))
+            end = driver.find_element(By.ID, "search_fechafin")
+            end.send_keys(session["finish"].strftime("%d/%m/%Y"))
+
+            search_button = driver.find_element(By.XPATH, "//input[@value='Buscar']")
+            driver.execute_script("arguments[0].click();", search_button)
+
+            try:
+                WebDriverWait(driver, timeout=10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "article"))
+                )
+            except TimeoutException:
+                raise VideoUrlNotFoundError(session["id"])
+
+            # Read the text and link of every result in a single round-trip
+            articles = driver.execute_script(ARTICLES_SCRIPT)
+            player_url = next(
+                (
+                    href
+                    for text, href in (reversed(articles) if is_morning else articles)
+                    if matches_keywords(text, keywords)
                 ),
-                results,
+                None,
             )
-        )
-
-        player_url = (
-            results[-1 if session["start"].time() < dt.time(hour=12, minute=0) else 0]
-            .find_element(By.TAG_NAME, "a")
-            .get_attribute("href")
-        )
 
-        driver.get(player_url)
+            if player_url is None:
+                raise VideoUrlNotFoundError(session["id"])
 
-        video_url = driver.find_element(By.CSS_SELECTOR, "a[download]").get_attribute(
-            "href"
-        )
+            driver.get(player_url)
 
-        driver.quit()
+            video_url = driver.find_element(
+                By.CSS_SELECTOR, "a[download]"
+            ).get_attribute("href")
 
-        return video_url
+            return video_url
 
 
 class ChamberOfDeputiesVideoProcessor(VideoProcessor):
@@ -324,6 +598,8 @@ class ChamberOfDeputiesVideoProcessor(VideoProcessor):
         super().__init__(
             videos_website="https://www.camara.cl/prensa/television.aspx",
         )
+        # Text of the commission dropdown option matched by each set of keywords
+        self.__option_texts = {}
 
     def get_video_url(self, session):
         """
@@ -339,86 +615,112 @@ class ChamberOfDeputiesVideoProcessor(VideoProcessor):
         Returns:
             String URL for direct video download
         """
-        driver = get_driver()
-        driver.get(self.videos_website)
+        is_morning = session["start"].time() < NOON
 
-        commission = get_db().find_commission(session["commission_id"])
+        with self.driver_pool.checkout() as driver:
+            driver.get(self.videos_website)
 
-        tab_commissions = driver.find_element(By.ID, "tab_comisiones")
-        tab_commissions.click()
+            commission = get_commission(session["commission_id"])
 
-        select_commission = Select(
-            driver.find_element(
-                By.XPATH,
-                "//td[contains(., 'Permanentes:')]/following-sibling::td[1]//select",
-            )
-        )
+            tab_commissions = driver.find_element(By.ID, "tab_comisiones")
+            tab_commissions.click()
 
-        for option in select_commission.options:
-            text = "".join(
-                char
-                for char in unicodedata.normalize("NFD", option.text.lower())
-                if unicodedata.category(char) != "Mn"
+            select_commission = Select(
+                driver.find_element(
+                    By.XPATH,
+                    "//td[contains(., 'Permanentes:')]/following-sibling::td[1]//select",
+                )
             )
-            if all(kw.lower() in text for kw in commission["search_keywords"]):
-                select_commission.select_by_visible_text(option.text)
-                break
 
-        WebDriverWait(driver, 10).until(
-            lambda x: x.find_element(By.XPATH, "//div[@role='status']").get_attribute(
-                "aria-hidden"
+            keywords = [normalize_text(kw) for kw in commission["search_keywords"]]
+            keywords_key = tuple(keywords)
+
+            if keywords_key not in self.__option_texts:
+                for option in select_commission.options:
+                    if matches_keywords(option.text, keywords):
+                        self.__option_texts[keywords_key] = option.text
+                        break
+
+            if keywords_key in self.__option_texts:
+                select_commission.select_by_visible_text(
+                    self.__option_texts[keywords_key]
+                )
+
+            WebDriverWait(driver, 10).until(
+                lambda x: x.find_element(
+                    By.XPATH, "//div[@role='status']"
+                ).get_attribute("aria-hidden")
+                == "true"
             )
-            == "true"
-        )
-
-        date_input = driver.find_element(
-            By.XPATH, "//td[contains(., 'Fecha:')]/following-sibling::td[1]//input"
-        )
-        date_input.send_keys(session["start"].strftime("%d/%m/%Y"))
 
-        search_button = driver.find_element(
-            By.XPATH, "//input[contains(@id, 'Buscar_comisiones')]"
-        )
-        ActionChains(driver).scroll_to_element(search_button).perform()
-        driver.execute_script("arguments[0].click();", search_button)
+            date_input = driver.find_element(
+                By.XPATH, "//td[contains(., 'Fecha:')]/following-sibling::td[1]//input"
+            )
+            date_input.send_keys(session["start"].strftime("%d/%m/%Y"))
 
-        WebDriverWait(driver, 10).until(
-            lambda x: x.find_element(By.XPATH, "//div[@role='status']").get_attribute(
-                "aria-hidden"
+            search_button = driver.find_element(
+                By.XPATH, "//input[contains(@id, 'Buscar_comisiones')]"
+            )
+            ActionChains(driver).scroll_to_element(search_button).perform()
+            driver.execute_script("arguments[0].click();", search_button)
+
+            WebDriverWait(driver, 10).until(
+                lambda x: x.find_element(
+                    By.XPATH, "//div[@role='status']"
+                ).get_attribute("aria-hidden")
+                == "true"
             )
-            == "true"
-        )
 
-        results_tab = driver.find_element(
-            By.XPATH, "//div[contains(@id, 'ResultadoBusqueda')]"
-        )
-        results = results_tab.find_elements(By.CSS_SELECTOR, "article > div:has(input)")
-        results = list(
-            filter(
-                lambda item: all(
-                    normalize_text(term) in normalize_text(item.text)
-                    for term in commission["search_keywords"]
+            results_tab = driver.find_element(
+                By.XPATH, "//div[contains(@id, 'ResultadoBusqueda')]"
+            )
+            # Read every result element along with its text in a single round-trip
+            results = driver.execute_script(RESULTS_SCRIPT, results_tab)
+            result = next(
+                (
+                    item
+                    for item, text in (reversed(results) if is_morning else results)
+                    if matches_keywords(text, keywords)
                 ),
-                results,
+                None,
             )
-        )
 
-        results[
-            -1 if session["start"].time() < dt.time(hour=12, minute=0) else 0
-        ].click()
+            if result is None:
+                raise VideoUrlNotFoundError(session["id"])
 
-        video_url = driver.find_element(By.ID, "btn_descargar").get_attribute("href")
+            result.click()
 
-        return video_url
+            video_url = driver.find_element(By.ID, "btn_descargar").get_attribute(
+                "href"
+            )
+
+            return video_url
 
 
-processors: dict[str, VideoProcessor] = {
-    "Senado": SenateVideoProcessor(),
-    "Cámara de Diputados": ChamberOfDeputiesVideoProcessor(),
+processors: dict[str, type[VideoProcessor]] = {
+    "Senado": SenateVideoProcessor,
+    "Cámara de Diputados": ChamberOfDeputiesVideoProcessor,
 }
 
 
-def get_video_processor(session):
+@cache
+def get_chamber_processor(chamber):
+    """
+    Get the shared video processor for a chamber.
+
+    The processor, along with its driver pool and HTTP session, is instantiated
+    on first use and reused afterwards.
+
+    Args:
+        chamber: Name of the chamber the session belongs to
+
+    Returns:
+        VideoProcessor instance for the given chamber
+    """
+    return processors[chamber]()
+
+
+def get_video_processor(session, commission=None):
     """
     Factory function to get the appropriate video processor for a session.
 
@@ -427,9 +729,11 @@ def get_video_processor(session):
 
     Args:
         session: Dictionary containing session information with commission_id
+        commission: The session's commission, if the caller already fetched it
 
     Returns:
         VideoProcessor instance appropriate for the session's chamber
     """
-    commission = get_db().find_commission(session["commission_id"])
-    return processors[commission["chamber"]]
+    if commission is None:
+        commission = get_commission(session["commission_id"])
+    return get_chamber_processor(commission["chamber"])
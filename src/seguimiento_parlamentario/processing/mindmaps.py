@@ -1,6 +1,43 @@
+import string
+from functools import cache
+from itertools import chain
 from abc import ABC, abstractmethod
+from seguimiento_parlamentario.core.utils import (
+    compact_transcript,
+    format_session_date,
+)
 from seguimiento_parlamentario.processing.prompting import PromptModel
-from babel.dates import format_datetime
+
+# Guidelines common to every mind map, sent with the system message so only the
+# session data at the end of the request changes between sessions
+INSTRUCTIONS = """
+El mapa mental debe estar enfocado en los temas más relevantes discutidos durante la sesión, no incluyas discusiones suspendidas o aplazadas.
+
+La raíz debe tener un título que sea representativo a lo discutido en la sesión. Cada rama que salga de la raíz debe abordar de forma general cada uno de los temas discutidos, y sus ramas hijas deben explicar a mayor detalle el tema discutido, explicando en que consiste y que acuerdos se obtuvieron, incluyendo datos específicos mencionados (como estadisticas, cifras relevantes, etc).
+
+Estructura el resultado como un objeto JSON con nodos padre-hijo. Cada nodo debe tener:
+- `name`: frase breve que explique la idea/concepto
+- `children`: lista de nodos hijos (puede estar vacía)
+
+Genera el JSON lo más limpio y estructurado posible.
+
+Evita estructuras estándar como Resumen o Conclusión. Además, el mapa mental debe ir más allá de simples etiquetas de categorías como `Educación` o `Ejemplos`. Debe incluir detalles específicos, completa con hechos, no sólo el punto de partida básico. Si hay demasiado contenido para un mapa mental, también puedes acortar e ir más general, pero sólo si es realmente necesario. Intenta llegar a 2-3 niveles de profundidad. El mapa mental no debe ser abrumador. Evita construir ramas muy profundas con pocas bifurcaciones, en esos casos prefiere incluir la información en un solo nodo, separado por comas. Evita generar frases muy extensas, el contenido de una rama debe ser breve y conciso, entre 10 a 20 palabras de longitud, si debes explicar hazlo en una de las ramas hijas.
+"""
+
+PROMPT_TEMPLATE = string.Template("""
+Genera un mapa mental a partir de la siguiente transcripción de una sesión de la $commission_name en $chamber de Chile, realizada el día $date.
+
+Aquí está el contexto, la lista de asistencia y la transcripción:
+
+### Contexto:
+$context
+
+### Participantes:
+$attendance
+
+### Transcripción:
+$transcript
+""")
 
 
 class MindMapGenerator(PromptModel, ABC):
@@ -20,7 +57,7 @@ class MindMapGenerator(PromptModel, ABC):
         an expert in parliamentary topics specializing in mind map generation.
         """
         base_system_message = "Eres un asistente experto en temas parlamentarios que genera mapas mentales sobre sesiones del Congreso de Chile, explicando los temas tratados de forma estructurada."
-        super().__init__(base_system_message)
+        super().__init__(base_system_message + "\n" + INSTRUCTIONS)
 
     def build_prompt(self, data):
         """
@@ -39,33 +76,14 @@ class MindMapGenerator(PromptModel, ABC):
         session = data["session"]
         commission = data["commission"]
 
-        prompt = f"""
-Genera un mapa mental a partir de la siguiente transcripción de una sesión de la {commission['name']} en {commission['chamber']} de Chile, realizada el día {format_datetime(session['start'], "EEEE d 'de' MMMM 'de' y", locale='es')}.
-
-El mapa mental debe estar enfocado en los temas más relevantes discutidos durante la sesión, no incluyas discusiones suspendidas o aplazadas.
-
-La raíz debe tener un título que sea representativo a lo discutido en la sesión. Cada rama que salga de la raíz debe abordar de forma general cada uno de los temas discutidos, y sus ramas hijas deben explicar a mayor detalle el tema discutido, explicando en que consiste y que acuerdos se obtuvieron, incluyendo datos específicos mencionados (como estadisticas, cifras relevantes, etc).
-
-Estructura el resultado como un objeto JSON con nodos padre-hijo. Cada nodo debe tener:
-- `name`: frase breve que explique la idea/concepto
-- `children`: lista de nodos hijos (puede estar vacía)
-
-Genera el JSON lo más limpio y estructurado posible.
-
-Evita estructuras estándar como Resumen o Conclusión. Además, el mapa mental debe ir más allá de simples etiquetas de categorías como `Educación` o `Ejemplos`. Debe incluir detalles específicos, completa con hechos, no sólo el punto de partida básico. Si hay demasiado contenido para un mapa mental, también puedes acortar e ir más general, pero sólo si es realmente necesario. Intenta llegar a 2-3 niveles de profundidad. El mapa mental no debe ser abrumador. Evita construir ramas muy profundas con pocas bifurcaciones, en esos casos prefiere incluir la información en un solo nodo, separado por comas. Evita generar frases muy extensas, el contenido de una rama debe ser breve y conciso, entre 10 a 20 palabras de longitud, si debes explicar hazlo en una de las ramas hijas.
-
-Aquí está el contexto, la lista de asistencia y la transcripción:
-
-### Contexto:
-{self.get_context(session)}
-
-### Participantes:
-{self.get_attendance(session)}
-
-### Transcripción:
-{session['transcript']}
-"""
-        return prompt
+        return PROMPT_TEMPLATE.substitute(
+            commission_name=commission["name"],
+            chamber=commission["chamber"],
+            date=format_session_date(session["start"]),
+            context=self.get_context(session),
+            attendance=self.get_attendance(session),
+            transcript=compact_transcript(session["transcript"]),
+        )
 
     @abstractmethod
     def get_context(self, session):
@@ -122,12 +140,10 @@ class SenateMindMapGenerator(MindMapGenerator):
         Returns:
             String containing formatted Senate context information
         """
-        contexts = []
-        for ctx in session["context"]:
-            contexts.append(
-                f"- Tema: {ctx.get('topic')}\n- Aspectos: {ctx.get('aspects')}\n- Acuerdos: {ctx.get('agreements')}"
-            )
-        return "\n".join(contexts)
+        return "\n".join(
+            f"- Tema: {ctx.get('topic')}\n- Aspectos: {ctx.get('aspects')}\n- Acuerdos: {ctx.get('agreements')}"
+            for ctx in session["context"]
+        )
 
     def get_attendance(self, session):
         """
@@ -142,14 +158,14 @@ class SenateMindMapGenerator(MindMapGenerator):
         Returns:
             String containing formatted Senate attendance information
         """
-        members = []
-        guests = []
-        for att in session["attendance"].get("members"):
-            members.append(f"- Nombre: {att}")
-        for att in session["attendance"].get("guests"):
-            guests.append(f"- {att}")
-        attendees = ["Miembros:", "\n".join(members), "Invitados:", "\n".join(guests)]
-        return "\n".join(attendees)
+        return "\n".join(
+            chain(
+                ["Miembros:"],
+                (f"- Nombre: {att}" for att in session["attendance"].get("members")),
+                ["Invitados:"],
+                (f"- {att}" for att in session["attendance"].get("guests")),
+            )
+        )
 
 
 class ChamberOfDeputiesMindMapGenerator(MindMapGenerator):
@@ -174,12 +190,10 @@ class ChamberOfDeputiesMindMapGenerator(MindMapGenerator):
         Returns:
             String containing formatted Chamber of Deputies context information
         """
-        contexts = []
-        for ctx in session["context"]:
-            contexts.append(
-                f"- Citación: {ctx.get('citation')}\n- Resultado: {ctx.get('result')}"
-            )
-        return "\n".join(contexts)
+        return "\n".join(
+            f"- Citación: {ctx.get('citation')}\n- Resultado: {ctx.get('result')}"
+            for ctx in session["context"]
+        )
 
     def get_attendance(self, session):
         """
@@ -194,18 +208,34 @@ class ChamberOfDeputiesMindMapGenerator(MindMapGenerator):
         Returns:
             String containing formatted Chamber of Deputies attendance information
         """
-        attendees = []
-        for att in session["attendance"]:
-            attendees.append(f"- Nombre: {att.get('name')} Estado: {att.get('status')}")
-        return "\n".join(attendees)
+        return "\n".join(
+            f"- Nombre: {att.get('name')} Estado: {att.get('status')}"
+            for att in session["attendance"]
+        )
 
 
-mindmap_generators: dict[str, MindMapGenerator] = {
-    "Senado": SenateMindMapGenerator(),
-    "Cámara de Diputados": ChamberOfDeputiesMindMapGenerator(),
+mindmap_generators: dict[str, type[MindMapGenerator]] = {
+    "Senado": SenateMindMapGenerator,
+    "Cámara de Diputados": ChamberOfDeputiesMindMapGenerator,
 }
 
 
+@cache
+def get_mindmap_generator(chamber):
+    """
+    Get the shared mind map generator for a chamber.
+
+    The generator is instantiated on first use and reused afterwards.
+
+    Args:
+        chamber: Name of the chamber the session belongs to
+
+    Returns:
+        MindMapGenerator instance for the given chamber
+    """
+    return mindmap_generators[chamber]()
+
+
 def get_mindmap(data):
     """
     Factory function to get the appropriate mind map generator for session data.
@@ -221,6 +251,4 @@ def get_mindmap(data):
     """
     commission = data["commission"]
 
-    mindmap_generator = mindmap_generators[commission["chamber"]]
-
-    return mindmap_generator
+    return get_mindmap_generator(commission["chamber"])
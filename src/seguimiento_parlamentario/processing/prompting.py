@@ -1,6 +1,29 @@
 from abc import ABC, abstractmethod
 from openai import OpenAI
+from seguimiento_parlamentario.core.db import get_db
+import hashlib
 import os
+import threading
+
+# Configuration read once at import; call reload_config after changing it
+OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+MODEL_NAME = os.getenv("MODEL_NAME")
+PROMPT_CACHE_ENABLED = os.getenv("PROMPT_CACHE") == "1"
+
+
+def reload_config():
+    """
+    Read the language model configuration from the environment again.
+
+    The shared client is dropped so the next request creates one with the
+    current API key.
+    """
+    global OPENROUTER_API_KEY, MODEL_NAME, PROMPT_CACHE_ENABLED
+    OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+    MODEL_NAME = os.getenv("MODEL_NAME")
+    PROMPT_CACHE_ENABLED = os.getenv("PROMPT_CACHE") == "1"
+    with PromptModel._client_lock:
+        PromptModel._client = None
 
 
 class PromptModel(ABC):
@@ -13,6 +36,10 @@ class PromptModel(ABC):
     for their particular use cases.
     """
 
+    # Client shared by every model, so connections are reused across requests
+    _client = None
+    _client_lock = threading.Lock()
+
     def __init__(self, base_system_message):
         """
         Initialize the prompt model with a system message.
@@ -26,39 +53,93 @@ class PromptModel(ABC):
         """
         self.base_system_message = base_system_message
 
-    def process(self, data):
+    def process(self, data, parse=None):
         """
         Process input data through the configured language model.
 
-        Creates a chat completion request using the system message and a dynamically
-        built prompt, then returns the AI-generated response. The method handles
-        API authentication and request formatting automatically.
+        Creates a streamed chat completion request using the system message and a
+        dynamically built prompt, then returns the AI-generated response. The method handles
+        API authentication and request formatting automatically. When PROMPT_CACHE is
+        set to 1, responses are cached in the database keyed by a hash of the model
+        and messages, so retries and reprocessing reuse them. When `parse` is given,
+        a response is only cached once it parses without raising.
 
         Args:
             data: Input data to be processed (format depends on subclass implementation)
+            parse: Optional function applied to the response before returning it
 
         Returns:
-            String containing the AI-generated response
+            String containing the AI-generated response, or the result of `parse`
 
         Environment Variables Required:
             OPENROUTER_API_KEY: API key for OpenRouter service
             MODEL_NAME: Name of the language model to use
         """
-        client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=os.getenv("OPENROUTER_API_KEY"),
+        model = MODEL_NAME
+        messages = self.build_messages(data)
+
+        db = get_db() if PROMPT_CACHE_ENABLED else None
+        if db is not None:
+            # The model takes part in the key, so switching models skips old entries
+            key = hashlib.sha256(
+                "\0".join([model] + [m["content"] for m in messages]).encode()
+            ).hexdigest()
+            cached = db.find_prompt_response(key)
+            if cached is not None:
+                return parse(cached) if parse else cached
+
+        stream = self.get_client().chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=True,
         )
+        # Tokens are read as they arrive instead of waiting for the whole body
+        parts = [
+            chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices
+        ]
+        result = "".join(parts)
+        # Parsing first keeps malformed responses out of the cache
+        parsed = parse(result) if parse else result
 
-        response = client.chat.completions.create(
-            model=os.getenv("MODEL_NAME"),
-            messages=[
-                {"role": "system", "content": self.base_system_message},
-                {"role": "user", "content": self.build_prompt(data)},
-            ],
-        )
-        result = response.choices[0].message.content
+        if db is not None:
+            db.add_prompt_response(key, result)
+
+        return parsed
+
+    def build_messages(self, data):
+        """
+        Build the chat messages sent to the language model for some input data.
 
-        return result
+        Args:
+            data: Input data to be transformed into a prompt
+
+        Returns:
+            List with the system message and the user prompt
+        """
+        return [
+            {"role": "system", "content": self.base_system_message},
+            {"role": "user", "content": self.build_prompt(data)},
+        ]
+
+    @classmethod
+    def get_client(cls):
+        """
+        Get the OpenRouter client shared by every prompt model.
+
+        The client is created on first use and reused afterwards, so its
+        connection pool is kept alive between requests.
+
+        Returns:
+            OpenAI client configured for the OpenRouter API
+        """
+        if PromptModel._client is None:
+            with PromptModel._client_lock:
+                if PromptModel._client is None:
+                    PromptModel._client = OpenAI(
+                        base_url="https://openrouter.ai/api/v1",
+                        api_key=OPENROUTER_API_KEY,
+                    )
+        return PromptModel._client
 
     @abstractmethod
     def build_prompt(self, data):
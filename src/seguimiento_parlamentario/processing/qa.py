@@ -1,7 +1,150 @@
+import json
+import time
+from collections import defaultdict
+from threading import Lock
+
+import numpy as np
+
 from seguimiento_parlamentario.processing.prompting import PromptModel
 from seguimiento_parlamentario.core.db import PineconeDatabase
 
 
+class SemanticCache:
+    """
+    In-memory cache of answers keyed by the embedding of their question.
+
+    A question is served from the cache when a previous question asked with the
+    same filters has a cosine similarity of at least `threshold` with it. Entries
+    expire after `ttl` seconds and the least recently used ones are evicted once
+    the cache holds `maxsize` answers.
+    """
+
+    def __init__(self, threshold=0.95, ttl=12 * 60 * 60, maxsize=1024):
+        """
+        Initialize an empty semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for two questions to match
+            ttl: Seconds an answer stays valid
+            maxsize: Maximum number of answers kept
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Entries are [filters key, normalized embedding, response, citation, expiry],
+        # ordered from least to most recently used
+        self.__entries = []
+        self.__lock = Lock()
+
+    def lookup(self, embedding, filters):
+        """
+        Find a cached answer for a question similar to the given one.
+
+        Args:
+            embedding: Embedding of the question
+            filters: Filters the question was asked with
+
+        Returns:
+            Tuple with the cached response and citation, or None on a miss
+        """
+        key = json.dumps(filters, sort_keys=True)
+        vector = self.__normalize(embedding)
+
+        with self.__lock:
+            now = time.monotonic()
+            self.__entries = [entry for entry in self.__entries if entry[4] > now]
+
+            candidates = [
+                i for i, entry in enumerate(self.__entries) if entry[0] == key
+            ]
+            if not candidates:
+                return None
+
+            similarities = np.stack([self.__entries[i][1] for i in candidates]) @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+
+            # Moved by position, as comparing entries would compare numpy arrays
+            entry = self.__entries.pop(candidates[best])
+            self.__entries.append(entry)
+            return entry[2], entry[3]
+
+    def insert(self, embedding, filters, response, citation):
+        """
+        Store the answer to a question.
+
+        Args:
+            embedding: Embedding of the question
+            filters: Filters the question was asked with
+            response: Generated response
+            citation: Citation mapping of the response
+        """
+        key = json.dumps(filters, sort_keys=True)
+        vector = self.__normalize(embedding)
+
+        with self.__lock:
+            self.__entries.append(
+                [key, vector, response, citation, time.monotonic() + self.ttl]
+            )
+            del self.__entries[: -self.maxsize]
+
+    def __normalize(self, embedding):
+        vector = np.asarray(embedding, dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+
+# Answers shared by every QuestionAnswerModel instance
+answer_cache = SemanticCache()
+
+
+def shingles(text, size=3):
+    """
+    Get the set of word n-grams of a text, ignoring case.
+
+    Args:
+        text: Text to split
+        size: Number of words per n-gram
+
+    Returns:
+        Set of n-gram tuples
+    """
+    words = text.lower().split()
+    return {tuple(words[i : i + size]) for i in range(max(len(words) - size + 1, 1))}
+
+
+def dedupe(chunks, threshold=0.8):
+    """
+    Drop chunks that are near-duplicates of an earlier one.
+
+    Two chunks are near-duplicates when the Jaccard similarity of their word
+    3-gram sets is at least `threshold`.
+
+    Args:
+        chunks: List of chunk texts, in order
+        threshold: Minimum similarity for a chunk to be dropped
+
+    Returns:
+        List with the chunks that were kept, in order
+    """
+    kept = []
+    kept_shingles = []
+    for chunk in chunks:
+        chunk_shingles = shingles(chunk)
+        if any(
+            len(chunk_shingles & other) >= threshold * len(chunk_shingles | other)
+            for other in kept_shingles
+        ):
+            continue
+        kept.append(chunk)
+        kept_shingles.append(chunk_shingles)
+    return kept
+
+
+# Answer given when the retrieved fragments cannot support a response
+NO_ANSWER_MESSAGE = "No tengo suficiente información para responder con certeza"
+
+
 class QuestionAnswerModel(PromptModel):
     """
     Specialized prompt model for answering questions about parliamentary activities.
@@ -11,15 +154,20 @@ class QuestionAnswerModel(PromptModel):
     accurate, cited responses about Chilean parliamentary sessions and activities.
     """
 
-    def __init__(self):
+    def __init__(self, dedupe_chunks=True):
         """
         Initialize the question answering model with parliamentary expertise.
 
         Sets up the system message that defines the AI assistant's role as
         an expert chatbot specializing in Chilean parliamentary topics.
+
+        Args:
+            dedupe_chunks: Whether to drop near-duplicate fragments of the same
+                           session before building the prompt
         """
         base_system_message = "Eres un chatbot experto en temas parlamentarios que responde preguntas sobre las actividades legislativas del Congreso de Chile."
         super().__init__(base_system_message)
+        self.dedupe_chunks = dedupe_chunks
 
     def build_prompt(self, data):
         """
@@ -43,7 +191,7 @@ A continuación se te proporcionan fragmentos de transcripciones del Congreso de
 
 Utiliza la numeración de los fragmentos para citar el contenido, usando el mismo formato de numeración con corchetes ([1], [2], [3], etc).
 
-Si la información proporcionada no es suficiente para dar una respuesta precisa, responde con "No tengo suficiente información para responder con certeza".
+Si la información proporcionada no es suficiente para dar una respuesta precisa, responde con "{NO_ANSWER_MESSAGE}".
 
 ### Fragmentos del Congreso:
 {self.build_chunks(chunks)}
@@ -68,6 +216,9 @@ Si la información proporcionada no es suficiente para dar una respuesta precisa
         Returns:
             String containing numbered and formatted document chunks
         """
+        if self.dedupe_chunks:
+            chunks = {session_id: dedupe(chunk) for session_id, chunk in chunks.items()}
+
         formatted_chunks = [
             f"[{i}] {' '.join(chunk)}"
             for i, (_, chunk) in enumerate(chunks.items(), start=1)
@@ -91,21 +242,18 @@ Si la información proporcionada no es suficiente para dar una respuesta precisa
                 - Dictionary mapping session IDs to lists of chunk texts
                 - Dictionary mapping citation numbers to session IDs
         """
-        chunks_by_session = {}
+        chunks_by_session = defaultdict(list)
 
         for chunk in chunks:
-            if not chunks_by_session.get(chunk["fields"]["session_id"]):
-                chunks_by_session[str(chunk["fields"]["session_id"])] = []
-            chunks_by_session[str(chunk["fields"]["session_id"])].append(
-                chunk["fields"]["chunk_text"]
-            )
+            fields = chunk["fields"]
+            chunks_by_session[str(fields["session_id"])].append(fields["chunk_text"])
 
         citation = {
             f"[{i}]": int(float(session_id))
-            for i, session_id in enumerate(chunks_by_session.keys(), start=1)
+            for i, session_id in enumerate(chunks_by_session, start=1)
         }
 
-        return chunks_by_session, citation
+        return dict(chunks_by_session), citation
 
     def ask(self, question, filters={}):
         """
@@ -114,7 +262,8 @@ Si la información proporcionada no es suficiente para dar una respuesta precisa
         This method orchestrates the complete question-answering pipeline:
         retrieving relevant chunks from the vector database, formatting them,
         processing through the language model, and returning both the response
-        and citation mapping.
+        and citation mapping. Answers to near-duplicate questions asked with the
+        same filters are served from a semantic cache.
 
         Args:
             question: User's question about parliamentary activities
@@ -127,11 +276,21 @@ Si la información proporcionada no es suficiente para dar una respuesta precisa
         """
         db = PineconeDatabase()
 
-        chunks = db.retrieve_records(question, filters=filters)
+        embedding = db.embed(question)
+        cached = answer_cache.lookup(embedding, filters)
+        if cached is not None:
+            return cached
+
+        chunks = db.retrieve_records(question, filters=filters, vector=embedding)
         chunks_by_session, citation = self.format_chunks(chunks)
 
+        # Without fragments the model can only decline, so skip the request
+        if not chunks_by_session:
+            return NO_ANSWER_MESSAGE, {}
+
         data = {"message": question, "chunks": chunks_by_session}
 
         response = self.process(data)
+        answer_cache.insert(embedding, filters, response, citation)
 
         return response, citation
@@ -1,6 +1,57 @@
 from abc import ABC, abstractmethod
+from functools import cache
+from itertools import chain
+from seguimiento_parlamentario.core.utils import (
+    compact_transcript,
+    format_session_date,
+)
 from seguimiento_parlamentario.processing.prompting import PromptModel
-from babel.dates import format_datetime
+
+SYSTEM_MESSAGE = "Eres un modelo experto en análisis legislativo. Tu tarea es leer y generar un reporte a partir de las transcripciones de sesiones del Congreso de Chile."
+
+# Report structure shared by every session. It is part of the system message so
+# requests start with the same prefix, which providers can serve from their
+# prompt cache; session-specific data only appears in the user prompt.
+INSTRUCTIONS = """
+Cada informe debe estar organizado en las siguientes secciones:
+
+# **Titular**: Crea un titular representativo de lo discutido en la sesión. Debe describir los temas tratados en la sesión.
+## **Palabras claves**: Enumera las cinco palabras claves que mejor describan el contenido de la sesión. Deben ser relevantes y específicas a los problemas tratados en la sesión. Descarta palabras que puedan ser muy generales y que apliquen a la mayoría de las sesiones, como 'Legislación' o 'Congreso'.
+## **Proyectos de ley**: Enumera los proyectos de ley y boletines discutidos en la sesión, junto con una breve descripción de lo que tratan.
+## **Participantes**: Enumera los participantes de la sesión en las siguientes categorías:
+### Parlamentarios principales: Enumera los parlamentarios que fueron más relevantes para la discusión.
+### Invitados a la comisión: Enumera los invitados que participaron activamente en la sesión, exponiendo sobre algún tema relevante.
+### Otros actores presentes: Esta sección es opcional, y solo debe ser incluída si algún participante relevante no pertenece a las categorías anteriores.
+## **Temas principales tratados**: Enumera los temas más importantes discutidos durante la sesión, en formato de lista clara.
+## **Resumen de la sesión**: Redacta un texto en formato de noticia que informe sobre todos los puntos abordados en la sesión. Debe responder el 'Qué', 'Quién', 'Como', 'Donde', 'Cuando' y 'Por qué'. Se debe mencionar quienes intervinieron, cuales fueron sus intervenciones, y cual fue el descenlace de la discusión. Este texto debe tener una extensión de 500 palabras aproximadamente.
+## **Puntos de acuerdo**: Describe los puntos o temas en los que hubo consenso entre los participantes. Incluye los argumentos más relevantes que se entregaron a favor y explica por qué se logró el acuerdo, y quienes intervinieron.
+## **Puntos de desacuerdo**: Describe los puntos o temas que generaron discusión o desacuerdo. Explica las posturas contrapuestas, incluyendo los argumentos clave entregados por las distintas partes, quienes dieron estos argumentos, y por qué no se logró llegar a un consenso. No incluyas tensiones producidas entre parlamentarios, sino que solo enfocate en las decisiones legislativas.
+## **Principales entidades nombradas**: Enumera personas, instituciones, eventos o lugares que fueron mencionadas en la sesión, y cual es su importancia para esta. Ignora entidades que sean muy generales y puedan aplicar a las demás sesiones, como 'Congreso', 'Gobierno de Chile' o los mismos parlamentarios.
+## **Insights accionables**: Enumera posibles insights accionables que puedan ser de ínteres para organizaciones dependientes de la legislación discutida (ej. que suscite decisiones, permita anticipar escenarios normativos, o guiar hacia objetivos de lobby).
+
+Instrucciones adicionales:
+- La respuesta debe estar estructurada en formato Markdown. Usa el titular generado como título principal (#), y el resto de secciones como subtítulos (##).
+- Usa tanto el contexto como la transcripción completa para elaborar un resumen lo más completo posible.
+- No te limites al contexto ni a la lista de participantes: es importante incluir las cosas que aparecen en la transcripción que fueron omitidas en el contexto.
+"""
+
+PROMPT_TEMPLATE = """
+Genera un informe de la siguiente transcripción de una sesión de la {commission_name} en {chamber} de Chile, realizada el día {session_date}.
+
+### Contexto:
+{context}
+
+### Participantes:
+{attendance}
+
+### Transcripción:
+{transcript}
+"""
+
+# Per-item line templates for the context and attendance sections
+SENATE_CONTEXT_LINE = "- Tema: {}\n- Aspectos: {}\n- Acuerdos: {}".format
+CHAMBER_CONTEXT_LINE = "- Citación: {}\n- Resultado: {}".format
+CHAMBER_ATTENDANCE_LINE = "- Nombre: {} Estado: {}".format
 
 
 class Summarizer(PromptModel, ABC):
@@ -19,8 +70,7 @@ class Summarizer(PromptModel, ABC):
         Sets up the base system message that defines the AI assistant's role as
         an expert in legislative analysis specializing in Chilean parliamentary sessions.
         """
-        base_system_message = "Eres un modelo experto en análisis legislativo. Tu tarea es leer y generar un reporte a partir de las transcripciones de sesiones del Congreso de Chile."
-        super().__init__(base_system_message)
+        super().__init__(SYSTEM_MESSAGE + "\n" + INSTRUCTIONS)
 
     def build_prompt(self, data):
         """
@@ -40,38 +90,16 @@ class Summarizer(PromptModel, ABC):
         session = data["session"]
         commission = data["commission"]
 
-        prompt = f"""
-Genera un informe de la siguiente transcripción de una sesión de la {commission['name']} en {commission['chamber']} de Chile, realizada el día {format_datetime(session['start'], "EEEE d 'de' MMMM 'de' y", locale='es')}. El resumen debe estar organizado en las siguientes secciones:
-
-# **Titular**: Crea un titular representativo de lo discutido en la sesión. Debe describir los temas tratados en la sesión.
-## **Palabras claves**: Enumera las cinco palabras claves que mejor describan el contenido de la sesión. Deben ser relevantes y específicas a los problemas tratados en la sesión. Descarta palabras que puedan ser muy generales y que apliquen a la mayoría de las sesiones, como 'Legislación' o 'Congreso'.
-## **Proyectos de ley**: Enumera los proyectos de ley y boletines discutidos en la sesión, junto con una breve descripción de lo que tratan.
-## **Participantes**: Enumera los participantes de la sesión en las siguientes categorías:
-### Parlamentarios principales: Enumera los parlamentarios que fueron más relevantes para la discusión.
-### Invitados a la comisión: Enumera los invitados que participaron activamente en la sesión, exponiendo sobre algún tema relevante.
-### Otros actores presentes: Esta sección es opcional, y solo debe ser incluída si algún participante relevante no pertenece a las categorías anteriores.
-## **Temas principales tratados**: Enumera los temas más importantes discutidos durante la sesión, en formato de lista clara.
-## **Resumen de la sesión**: Redacta un texto en formato de noticia que informe sobre todos los puntos abordados en la sesión. Debe responder el 'Qué', 'Quién', 'Como', 'Donde', 'Cuando' y 'Por qué'. Se debe mencionar quienes intervinieron, cuales fueron sus intervenciones, y cual fue el descenlace de la discusión. Este texto debe tener una extensión de 500 palabras aproximadamente.
-## **Puntos de acuerdo**: Describe los puntos o temas en los que hubo consenso entre los participantes. Incluye los argumentos más relevantes que se entregaron a favor y explica por qué se logró el acuerdo, y quienes intervinieron.
-## **Puntos de desacuerdo**: Describe los puntos o temas que generaron discusión o desacuerdo. Explica las posturas contrapuestas, incluyendo los argumentos clave entregados por las distintas partes, quienes dieron estos argumentos, y por qué no se logró llegar a un consenso. No incluyas tensiones producidas entre parlamentarios, sino que solo enfocate en las decisiones legislativas.
-## **Principales entidades nombradas**: Enumera personas, instituciones, eventos o lugares que fueron mencionadas en la sesión, y cual es su importancia para esta. Ignora entidades que sean muy generales y puedan aplicar a las demás sesiones, como 'Congreso', 'Gobierno de Chile' o los mismos parlamentarios.
-## **Insights accionables**: Enumera posibles insights accionables que puedan ser de ínteres para organizaciones dependientes de la legislación discutida (ej. que suscite decisiones, permita anticipar escenarios normativos, o guiar hacia objetivos de lobby).
-
-Instrucciones adicionales:
-- La respuesta debe estar estructurada en formato Markdown. Usa el titular generado como título principal (#), y el resto de secciones como subtítulos (##).
-- Usa tanto el contexto como la transcripción completa para elaborar un resumen lo más completo posible.
-- No te limites al contexto ni a la lista de participantes: es importante incluir las cosas que aparecen en la transcripción que fueron omitidas en el contexto.
-
-### Contexto:
-{self.get_context(session)}
-
-### Participantes:
-{self.get_attendance(session)}
-
-### Transcripción:
-{session['transcript']}
-"""
-        return prompt
+        return PROMPT_TEMPLATE.format_map(
+            {
+                "commission_name": commission["name"],
+                "chamber": commission["chamber"],
+                "session_date": format_session_date(session["start"]),
+                "context": self.get_context(session),
+                "attendance": self.get_attendance(session),
+                "transcript": compact_transcript(session["transcript"]),
+            }
+        )
 
     @abstractmethod
     def get_context(self, session):
@@ -128,12 +156,12 @@ class SenateSummarizer(Summarizer):
         Returns:
             String containing formatted Senate context information
         """
-        contexts = []
-        for ctx in session["context"]:
-            contexts.append(
-                f"- Tema: {ctx.get('topic')}\n- Aspectos: {ctx.get('aspects')}\n- Acuerdos: {ctx.get('agreements')}"
+        return "\n".join(
+            SENATE_CONTEXT_LINE(
+                ctx.get("topic"), ctx.get("aspects"), ctx.get("agreements")
             )
-        return "\n".join(contexts)
+            for ctx in session["context"]
+        )
 
     def get_attendance(self, session):
         """
@@ -148,14 +176,14 @@ class SenateSummarizer(Summarizer):
         Returns:
             String containing formatted Senate attendance information
         """
-        members = []
-        guests = []
-        for att in session["attendance"].get("members"):
-            members.append(f"- Nombre: {att}")
-        for att in session["attendance"].get("guests"):
-            guests.append(f"- {att}")
-        attendees = ["Miembros:", "\n".join(members), "Invitados:", "\n".join(guests)]
-        return "\n".join(attendees)
+        return "\n".join(
+            chain(
+                ["Miembros:"],
+                map("- Nombre: {}".format, session["attendance"].get("members")),
+                ["Invitados:"],
+                map("- {}".format, session["attendance"].get("guests")),
+            )
+        )
 
 
 class ChamberOfDeputiesSummarizer(Summarizer):
@@ -180,12 +208,10 @@ class ChamberOfDeputiesSummarizer(Summarizer):
         Returns:
             String containing formatted Chamber of Deputies context information
         """
-        contexts = []
-        for ctx in session["context"]:
-            contexts.append(
-                f"- Citación: {ctx.get('citation')}\n- Resultado: {ctx.get('result')}"
-            )
-        return "\n".join(contexts)
+        return "\n".join(
+            CHAMBER_CONTEXT_LINE(ctx.get("citation"), ctx.get("result"))
+            for ctx in session["context"]
+        )
 
     def get_attendance(self, session):
         """
@@ -200,18 +226,34 @@ class ChamberOfDeputiesSummarizer(Summarizer):
         Returns:
             String containing formatted Chamber of Deputies attendance information
         """
-        attendees = []
-        for att in session["attendance"]:
-            attendees.append(f"- Nombre: {att.get('name')} Estado: {att.get('status')}")
-        return "\n".join(attendees)
+        return "\n".join(
+            CHAMBER_ATTENDANCE_LINE(att.get("name"), att.get("status"))
+            for att in session["attendance"]
+        )
 
 
-summarizers: dict[str, Summarizer] = {
-    "Senado": SenateSummarizer(),
-    "Cámara de Diputados": ChamberOfDeputiesSummarizer(),
+summarizers: dict[str, type[Summarizer]] = {
+    "Senado": SenateSummarizer,
+    "Cámara de Diputados": ChamberOfDeputiesSummarizer,
 }
 
 
+@cache
+def get_chamber_summarizer(chamber):
+    """
+    Get the shared summarizer for a chamber.
+
+    The summarizer is instantiated on first use and reused afterwards.
+
+    Args:
+        chamber: Name of the chamber the session belongs to
+
+    Returns:
+        Summarizer instance for the given chamber
+    """
+    return summarizers[chamber]()
+
+
 def get_summarizer(data):
     """
     Factory function to get the appropriate summarizer for session data.
@@ -227,6 +269,4 @@ def get_summarizer(data):
     """
     commission = data["commission"]
 
-    summarizer = summarizers[commission["chamber"]]
-
-    return summarizer
+    return get_chamber_summarizer(commission["chamber"])
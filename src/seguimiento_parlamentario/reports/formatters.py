@@ -7,11 +7,24 @@ from jinja2 import Environment, FileSystemLoader
 from markdown_pdf import MarkdownPdf, Section
 
 from seguimiento_parlamentario.core.db import get_db
-from seguimiento_parlamentario.core.utils import convert_datetime_strings_to_datetime
+from seguimiento_parlamentario.core.utils import (
+    ES_LOCALE,
+    convert_datetime_strings_to_datetime,
+)
 
 # Initialize database connection
 db = get_db()
 
+# Templates are compiled once and reused for every render
+env = Environment(loader=FileSystemLoader(Path(__file__).parent), auto_reload=False)
+mindmap_template = env.get_template("mindmap.html")
+
+# Markdown converter built once; reset before each conversion to clear its state
+md_converter = markdown.Markdown()
+
+# PDF stylesheet, static for the lifetime of the process
+PDF_CSS = (Path(__file__).parent / "styles.css").read_text(encoding="utf-8")
+
 
 class SummaryFormatter:
     """
@@ -55,7 +68,7 @@ class SummaryFormatter:
         """
         raw_md, session, commission = self.get_metadata(summary)
         intro = f"""
-**{commission["name"]} ({commission["chamber"]}) - {format_datetime(session['start'], "EEEE d 'de' MMMM 'de' y HH:mm", locale='es').capitalize()}**
+**{commission["name"]} ({commission["chamber"]}) - {format_datetime(session['start'], "EEEE d 'de' MMMM 'de' y HH:mm", locale=ES_LOCALE).capitalize()}**
 """
         return "\n".join([intro, raw_md])
 
@@ -70,7 +83,7 @@ class SummaryFormatter:
             str: The HTML representation of the summary.
         """
         md_format = self.to_markdown(summary)
-        html_format = markdown.markdown(md_format)
+        html_format = md_converter.reset().convert(md_format)
         return html_format
 
     def to_pdf(self, summary):
@@ -86,12 +99,10 @@ class SummaryFormatter:
         md_format = self.to_markdown(summary)
         pdf = MarkdownPdf(toc_level=2, optimize=True)
 
-        current_folder = Path(__file__).parent
-        with open(current_folder / "styles.css", "r", encoding="utf-8") as styles:
-            pdf.add_section(
-                Section(md_format, paper_size="A4", borders=(50, 50, -50, -50)),
-                user_css=styles.read(),
-            )
+        pdf.add_section(
+            Section(md_format, paper_size="A4", borders=(50, 50, -50, -50)),
+            user_css=PDF_CSS,
+        )
 
         buffer = io.BytesIO()
         pdf.save(buffer)
@@ -139,14 +150,11 @@ class MindmapFormatter:
         session = db.find_session(mindmap["session_id"])
         commission = db.find_commission(session["commission_id"])
 
-        env = Environment(loader=FileSystemLoader(Path(__file__).parent))
-        template = env.get_template("mindmap.html")
-
         context = {
             "session": session,
             "commission": commission,
             "data": json_mindmap,
         }
 
-        rendered_html = template.render(context)
+        rendered_html = mindmap_template.render(context)
         return rendered_html